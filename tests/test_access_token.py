@@ -2,6 +2,7 @@
 Tests for Personal Access Token functionality.
 """
 
+import json
 import os
 import pytest
 from unittest.mock import Mock, patch, call
@@ -41,7 +42,16 @@ class TestAccessTokenClient:
         assert "Authorization" in headers
         assert headers["Authorization"] == f"Bearer {token}"
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    def test_request_headers_built_once(self):
+        """The headers mapping is built at init and shared read-only across calls."""
+        client = WikipediaClient(access_token="test_token_123")
+
+        headers = client._get_request_headers()
+        assert headers is client._get_request_headers()
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer other"
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_search_uses_auth_headers(self, mock_get):
         """Test that search method uses authentication headers when token is provided."""
         token = "test_token_123"
@@ -50,19 +60,21 @@ class TestAccessTokenClient:
         # Mock successful response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "Test Article",
-                        "snippet": "Test snippet",
-                        "pageid": 123,
-                        "wordcount": 100,
-                        "timestamp": "2023-01-01T00:00:00Z",
-                    }
-                ]
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "search": [
+                        {
+                            "title": "Test Article",
+                            "snippet": "Test snippet",
+                            "pageid": 123,
+                            "wordcount": 100,
+                            "timestamp": "2023-01-01T00:00:00Z",
+                        }
+                    ]
+                }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         # Perform search
@@ -72,12 +84,14 @@ class TestAccessTokenClient:
         mock_get.assert_called_once()
         call_args = mock_get.call_args
 
-        # Check that headers include authorization
-        headers = call_args[1]["headers"]
+        # Check that the request went through the client's session, whose
+        # default headers include authorization
+        assert "headers" not in call_args[1]
+        headers = client._session.headers
         assert "Authorization" in headers
         assert headers["Authorization"] == f"Bearer {token}"
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_get_coordinates_uses_auth_headers(self, mock_get):
         """Test that get_coordinates method uses authentication headers when token is provided."""
         token = "test_token_123"
@@ -86,24 +100,26 @@ class TestAccessTokenClient:
         # Mock successful response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "pages": {
-                    "123": {
-                        "pageid": 123,
-                        "title": "Test Article",
-                        "coordinates": [
-                            {
-                                "lat": 40.7128,
-                                "lon": -74.0060,
-                                "primary": True,
-                                "globe": "earth",
-                            }
-                        ],
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "pages": {
+                        "123": {
+                            "pageid": 123,
+                            "title": "Test Article",
+                            "coordinates": [
+                                {
+                                    "lat": 40.7128,
+                                    "lon": -74.0060,
+                                    "primary": True,
+                                    "globe": "earth",
+                                }
+                            ],
+                        }
                     }
                 }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         # Perform get_coordinates
@@ -113,8 +129,10 @@ class TestAccessTokenClient:
         mock_get.assert_called_once()
         call_args = mock_get.call_args
 
-        # Check that headers include authorization
-        headers = call_args[1]["headers"]
+        # Check that the request went through the client's session, whose
+        # default headers include authorization
+        assert "headers" not in call_args[1]
+        headers = client._session.headers
         assert "Authorization" in headers
         assert headers["Authorization"] == f"Bearer {token}"
 
@@ -256,7 +274,7 @@ class TestAccessTokenSecurity:
         client_repr = repr(client)
         assert token not in client_repr
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_error_logging_no_token_exposure(self, mock_get, caplog):
         """Test that errors don't expose the access token."""
         import logging
@@ -2,7 +2,12 @@
 Tests for Wikipedia coordinates functionality.
 """
 
+import asyncio
+import json
+
+import httpx
 import pytest
+import requests
 from unittest.mock import Mock, patch, MagicMock
 
 from wikipedia_mcp.wikipedia_client import WikipediaClient
@@ -16,30 +21,32 @@ class TestWikipediaClientCoordinates:
         """Set up test fixtures."""
         self.client = WikipediaClient(language="en")
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_get_coordinates_success(self, mock_get):
         """Test successful coordinate retrieval."""
         # Mock successful API response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "pages": {
-                    "123456": {
-                        "pageid": 123456,
-                        "title": "Statue of Liberty",
-                        "coordinates": [
-                            {
-                                "lat": 40.689247,
-                                "lon": -74.044502,
-                                "primary": True,
-                                "globe": "earth",
-                            }
-                        ],
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "pages": {
+                        "123456": {
+                            "pageid": 123456,
+                            "title": "Statue of Liberty",
+                            "coordinates": [
+                                {
+                                    "lat": 40.689247,
+                                    "lon": -74.044502,
+                                    "primary": True,
+                                    "globe": "earth",
+                                }
+                            ],
+                        }
                     }
                 }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         result = self.client.get_coordinates("Statue of Liberty")
@@ -67,13 +74,15 @@ class TestWikipediaClientCoordinates:
         assert coord["primary"] is True
         assert coord["globe"] == "earth"
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_get_coordinates_no_coordinates(self, mock_get):
         """Test article with no coordinates."""
         # Mock API response for article without coordinates
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"query": {"pages": {"789012": {"pageid": 789012, "title": "Test Article"}}}}
+        mock_response.content = json.dumps(
+            {"query": {"pages": {"789012": {"pageid": 789012, "title": "Test Article"}}}}
+        ).encode()
         mock_get.return_value = mock_response
 
         result = self.client.get_coordinates("Test Article")
@@ -85,15 +94,15 @@ class TestWikipediaClientCoordinates:
         assert result["error"] is None
         assert result["message"] == "No coordinates available for this article"
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_get_coordinates_page_not_found(self, mock_get):
         """Test coordinates for non-existent page."""
         # Mock API response for non-existent page
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {"pages": {"-1": {"title": "Non-existent Article", "missing": True}}}
-        }
+        mock_response.content = json.dumps(
+            {"query": {"pages": {"-1": {"title": "Non-existent Article", "missing": True}}}}
+        ).encode()
         mock_get.return_value = mock_response
 
         result = self.client.get_coordinates("Non-existent Article")
@@ -103,40 +112,58 @@ class TestWikipediaClientCoordinates:
         assert result["coordinates"] is None
         assert result["error"] == "Page does not exist"
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_coordinates_invalid_title(self, mock_get):
+        """Titles the API flags as invalid are reported as non-existent."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {"query": {"pages": {"-1": {"title": "Bad<Title>", "invalid": "", "coordinates": [{"lat": 1, "lon": 2}]}}}}
+        ).encode()
+        mock_get.return_value = mock_response
+
+        result = self.client.get_coordinates("Bad<Title>")
+
+        assert result["exists"] is False
+        assert result["coordinates"] is None
+        assert result["error"] == "Page does not exist"
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_get_coordinates_multiple_coordinates(self, mock_get):
         """Test article with multiple coordinate systems."""
         # Mock API response with multiple coordinates
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "pages": {
-                    "345678": {
-                        "pageid": 345678,
-                        "title": "Multi-location Article",
-                        "coordinates": [
-                            {
-                                "lat": 40.689247,
-                                "lon": -74.044502,
-                                "primary": True,
-                                "globe": "earth",
-                                "type": "landmark",
-                                "name": "Main location",
-                            },
-                            {
-                                "lat": 40.690000,
-                                "lon": -74.045000,
-                                "primary": False,
-                                "globe": "earth",
-                                "type": "region",
-                                "name": "Secondary location",
-                            },
-                        ],
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "pages": {
+                        "345678": {
+                            "pageid": 345678,
+                            "title": "Multi-location Article",
+                            "coordinates": [
+                                {
+                                    "lat": 40.689247,
+                                    "lon": -74.044502,
+                                    "primary": True,
+                                    "globe": "earth",
+                                    "type": "landmark",
+                                    "name": "Main location",
+                                },
+                                {
+                                    "lat": 40.690000,
+                                    "lon": -74.045000,
+                                    "primary": False,
+                                    "globe": "earth",
+                                    "type": "region",
+                                    "name": "Secondary location",
+                                },
+                            ],
+                        }
                     }
                 }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         result = self.client.get_coordinates("Multi-location Article")
@@ -161,11 +188,11 @@ class TestWikipediaClientCoordinates:
         assert secondary_coord["type"] == "region"
         assert secondary_coord["name"] == "Secondary location"
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_get_coordinates_api_error(self, mock_get):
         """Test handling of API errors."""
         # Mock API error
-        mock_get.side_effect = Exception("Connection error")
+        mock_get.side_effect = requests.exceptions.ConnectionError("Connection error")
 
         result = self.client.get_coordinates("Any Article")
 
@@ -174,13 +201,44 @@ class TestWikipediaClientCoordinates:
         assert result["coordinates"] is None
         assert "Connection error" in result["error"]
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_coordinates_batch_raises_unexpected_errors(self, mock_get):
+        """Bugs in response handling propagate instead of becoming per-title errors."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps({"query": {"normalized": [{}], "pages": []}}).encode()
+        mock_get.return_value = mock_response
+
+        with pytest.raises(KeyError):
+            self.client.get_coordinates_batch(["Paris"])
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_coordinates_empty_body_or_server_error(self, mock_get):
+        """Empty bodies and error statuses produce an error without parsing the body."""
+        empty = Mock(status_code=200, content=b"")
+        unavailable = requests.Response()
+        unavailable.status_code = 503
+        unavailable.reason = "Service Unavailable"
+        unavailable._content = b"<html>upstream error</html>"
+        mock_get.side_effect = [empty, unavailable]
+
+        with patch("wikipedia_mcp.wikipedia_client._loads") as mock_loads:
+            first = self.client.get_coordinates("Paris")
+            second = self.client.get_coordinates("Paris")
+
+        mock_loads.assert_not_called()
+        assert first["error"] == "Empty response from the Wikipedia API (HTTP 200)"
+        assert first["exists"] is False
+        assert second["error"].startswith("503 Server Error")
+        assert second["coordinates"] is None
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_get_coordinates_empty_response(self, mock_get):
         """Test handling of empty API response."""
         # Mock empty API response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"query": {}}
+        mock_response.content = json.dumps({"query": {}}).encode()
         mock_get.return_value = mock_response
 
         result = self.client.get_coordinates("Test Article")
@@ -190,24 +248,122 @@ class TestWikipediaClientCoordinates:
         assert result["coordinates"] is None
         assert result["error"] == "No page found"
 
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_coordinates_batch_single_request(self, mock_get):
+        """Several titles are looked up in one request and mapped back to the requested titles."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "normalized": [{"fromencoded": False, "from": "paris", "to": "Paris"}],
+                    "pages": [
+                        {
+                            "pageid": 1,
+                            "title": "Paris",
+                            "coordinates": [{"lat": 48.85, "lon": 2.35, "primary": True, "globe": "earth"}],
+                        },
+                        {"pageid": 2, "title": "Abstract algebra"},
+                        {"title": "Nowhere", "missing": True},
+                        {"title": "Nowhere else", "missing": True},
+                    ],
+                }
+            }
+        ).encode()
+        mock_get.return_value = mock_response
+
+        results = self.client.get_coordinates_batch(["paris", "Abstract algebra", "Nowhere", "Nowhere else", "paris"])
+
+        mock_get.assert_called_once()
+        params = mock_get.call_args[1]["params"]
+        assert params["titles"] == "paris|Abstract algebra|Nowhere|Nowhere else"
+        assert params["colimit"] == "max"
+        assert params["formatversion"] == 2
+        assert list(results) == ["paris", "Abstract algebra", "Nowhere", "Nowhere else"]
+        assert results["paris"]["title"] == "Paris"
+        assert results["paris"]["coordinates"][0]["latitude"] == 48.85
+        assert results["paris"]["coordinates"][0]["primary"] is True
+        assert results["Abstract algebra"]["coordinates"] is None
+        assert results["Abstract algebra"]["exists"] is True
+        assert results["Nowhere"]["exists"] is False
+        assert results["Nowhere else"]["error"] == "Page does not exist"
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_coordinates_batch_splits_large_requests(self, mock_get):
+        """More than 50 titles are split across requests; a failed batch reports errors."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("Connection error")
+
+        results = self.client.get_coordinates_batch([f"Title {i}" for i in range(60)])
+
+        assert mock_get.call_count == 2
+        assert len(mock_get.call_args_list[0][1]["params"]["titles"].split("|")) == 50
+        assert len(results) == 60
+        assert all(result["error"] == "Connection error" for result in results.values())
+
+    @pytest.mark.asyncio
+    async def test_get_coordinates_async_concurrent_lookups(self):
+        """Async lookups share the pooled httpx client and match the sync results."""
+        seen = []
+
+        def handler(request):
+            title = request.url.params["titles"]
+            seen.append(title)
+            if title == "Missing":
+                return httpx.Response(200, json={"query": {"pages": [{"title": "Missing", "missing": True}]}})
+            return httpx.Response(
+                200,
+                json={"query": {"pages": [{"pageid": 1, "title": title, "coordinates": [{"lat": 1.5, "lon": 2.5}]}]}},
+            )
+
+        async with self.client:
+            self.client._get_async_http()._transport = httpx.MockTransport(handler)
+            paris, missing = await asyncio.gather(
+                self.client.get_coordinates_async("Paris"),
+                self.client.get_coordinates_async("Missing"),
+            )
+
+        assert sorted(seen) == ["Missing", "Paris"]
+        assert paris["exists"] is True
+        assert paris["coordinates"][0]["latitude"] == 1.5
+        assert paris["coordinates"][0]["globe"] == "earth"
+        assert missing["exists"] is False
+        assert missing["error"] == "Page does not exist"
+
+    @pytest.mark.asyncio
+    async def test_get_coordinates_async_api_error(self):
+        """API error payloads are reported like on the sync path."""
+
+        def handler(request):
+            return httpx.Response(200, json={"error": {"code": "maxlag", "info": "Waiting for a database server"}})
+
+        async with self.client:
+            self.client._get_async_http()._transport = httpx.MockTransport(handler)
+            result = await self.client.get_coordinates_async("Paris")
+
+        assert result["exists"] is False
+        assert result["coordinates"] is None
+        assert result["error"] == "Wikipedia API error: maxlag - Waiting for a database server"
+
     def test_get_coordinates_with_language_variant(self):
         """Test coordinates with language variants."""
         client = WikipediaClient(language="zh-hans")
 
-        with patch("wikipedia_mcp.wikipedia_client.requests.get") as mock_get:
+        with patch("wikipedia_mcp.wikipedia_client.requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.raise_for_status.return_value = None
-            mock_response.json.return_value = {
-                "query": {
-                    "pages": {
-                        "123": {
-                            "pageid": 123,
-                            "title": "测试文章",
-                            "coordinates": [{"lat": 39.9042, "lon": 116.4074, "primary": True}],
+            mock_response.content = json.dumps(
+                {
+                    "query": {
+                        "pages": {
+                            "123": {
+                                "pageid": 123,
+                                "title": "测试文章",
+                                "coordinates": [{"lat": 39.9042, "lon": 116.4074, "primary": True}],
+                            }
                         }
                     }
                 }
-            }
+            ).encode()
             mock_get.return_value = mock_response
 
             result = client.get_coordinates("测试文章")
@@ -219,11 +375,25 @@ class TestWikipediaClientCoordinates:
             assert result["exists"] is True
 
     def test_get_coordinates_caching(self):
-        """Test that caching is applied when enabled."""
+        """Answered lookups are cached per normalized title; failed requests are not."""
         client = WikipediaClient(language="en", enable_cache=True)
-
-        # Check that get_coordinates method is cached
-        assert hasattr(client.get_coordinates, "cache_info")
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        page = {"pageid": 1, "title": "New York", "coordinates": [{"lat": 40.7, "lon": -74.0}]}
+        mock_response.content = json.dumps({"query": {"pages": {"1": page}}}).encode()
+        responses = [requests.exceptions.ConnectionError("Connection error"), mock_response]
+
+        with patch.object(client._session, "get", side_effect=responses) as mock_get:
+            assert client.get_coordinates("New York")["error"] == "Connection error"
+            first = client.get_coordinates("New York")
+            assert client.get_coordinates("new_York ") is first
+            assert client.get_coordinates_batch(["New York"])["New York"] is first
+            assert mock_get.call_count == 2
+
+            client.clear_cache()
+            mock_get.side_effect = [mock_response]
+            client.get_coordinates("New York")
+            assert mock_get.call_count == 3
 
 
 class TestServerCoordinatesTool:
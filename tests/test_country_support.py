@@ -2,6 +2,7 @@
 Tests for country/locale support functionality.
 """
 
+import json
 import pytest
 from unittest.mock import patch, Mock
 from wikipedia_mcp.wikipedia_client import WikipediaClient
@@ -71,6 +72,51 @@ class TestCountryToLanguageMapping:
             result = client._resolve_country_to_language(country)
             assert result == expected_lang, f"Failed for {country}: expected {expected_lang}, got {result}"
 
+    def test_resolve_country_multiword_names_any_case(self):
+        """Multi-word country names resolve regardless of case and surrounding whitespace."""
+        client = WikipediaClient()
+
+        assert client._resolve_country_to_language("bosnia and herzegovina") == "bs"
+        assert client._resolve_country_to_language("  SOUTH KOREA ") == "ko"
+        assert client._resolve_country_to_language("united states") == "en"
+
+    def test_resolve_country_acronyms_and_mixed_case(self):
+        """Acronyms and names resolve in any case without title-casing (e.g. "UAE" is not "Uae")."""
+        client = WikipediaClient()
+
+        for country, expected in [
+            ("UAE", "ar"),
+            ("uae", "ar"),
+            ("uSa", "en"),
+            ("uk", "en"),
+            ("hong KONG", "zh-hk"),
+            ("\tTaiwan\n", "zh-tw"),
+        ]:
+            assert client._resolve_country_to_language(country) == expected, country
+
+    def test_country_names_reference_known_codes(self):
+        """Every country name points at a code, and resolves to that code's language."""
+        from wikipedia_mcp.wikipedia_client import _CODE_TO_LANG, _NAME_TO_CODE
+
+        client = WikipediaClient()
+        for name, code in _NAME_TO_CODE.items():
+            assert code in _CODE_TO_LANG, f"{name} points at unknown code {code}"
+            assert client._resolve_country_to_language(name) == _CODE_TO_LANG[code]
+
+    def test_resolution_is_memoized_across_clients(self):
+        """Country and variant resolution results are shared by all clients."""
+        from wikipedia_mcp.wikipedia_client import _parse_language_variant, _resolve_country_to_language
+
+        _resolve_country_to_language.cache_clear()
+        _parse_language_variant.cache_clear()
+
+        first = WikipediaClient(country="TW")
+        second = WikipediaClient(country="TW")
+
+        assert (first.base_language, first.language_variant) == (second.base_language, second.language_variant)
+        assert _resolve_country_to_language.cache_info().hits == 1
+        assert _parse_language_variant.cache_info().hits == 1
+
     def test_resolve_country_invalid_code(self):
         """Test error handling for invalid country codes."""
         client = WikipediaClient()
@@ -195,25 +241,27 @@ class TestServerCountryIntegration:
 class TestCountryAPIIntegration:
     """Test API integration with country codes."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_search_with_country_code(self, mock_get):
         """Test that search works correctly with country-resolved language."""
         # Setup mock response for Chinese Wikipedia
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "中華民國",
-                        "snippet": "Taiwan search result",
-                        "pageid": 123,
-                        "wordcount": 1000,
-                        "timestamp": "2024-01-01T00:00:00Z",
-                    }
-                ]
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "search": [
+                        {
+                            "title": "中華民國",
+                            "snippet": "Taiwan search result",
+                            "pageid": 123,
+                            "wordcount": 1000,
+                            "timestamp": "2024-01-01T00:00:00Z",
+                        }
+                    ]
+                }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         # Test search with Taiwan country code
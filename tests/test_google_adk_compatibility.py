@@ -108,14 +108,14 @@ class TestGoogleADKCompatibility:
 
         # This tests the logic used in extract_key_facts tool
         def convert_topic(topic_within_article: str):
-            return topic_within_article if topic_within_article.strip() else None
+            return topic_within_article.strip() or None
 
         # Test cases
         assert convert_topic("") is None
         assert convert_topic("   ") is None  # whitespace only
         assert convert_topic("general") == "general"
         assert convert_topic("history") == "history"
-        assert convert_topic(" history ") == " history "  # preserve as-is
+        assert convert_topic(" history ") == "history"  # normalized for consistent cache keys
 
     @pytest.mark.asyncio
     async def test_tool_compatibility_json_serialization(self):
@@ -2,6 +2,7 @@
 Tests for language variant support functionality.
 """
 
+import json
 import pytest
 from unittest.mock import patch, Mock
 from wikipedia_mcp.wikipedia_client import WikipediaClient
@@ -128,25 +129,27 @@ class TestLanguageVariantAPIIntegration:
         assert "variant" in updated_params
         assert "variant" not in original_params
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_search_with_language_variant(self, mock_get):
         """Test that search method includes variant parameter in API call."""
         # Setup mock response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "中国",
-                        "snippet": "Test snippet",
-                        "pageid": 123,
-                        "wordcount": 1000,
-                        "timestamp": "2024-01-01T00:00:00Z",
-                    }
-                ]
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "search": [
+                        {
+                            "title": "中国",
+                            "snippet": "Test snippet",
+                            "pageid": 123,
+                            "wordcount": 1000,
+                            "timestamp": "2024-01-01T00:00:00Z",
+                        }
+                    ]
+                }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         # Test search with Chinese variant
@@ -168,25 +171,27 @@ class TestLanguageVariantAPIIntegration:
         assert len(results) == 1
         assert results[0]["title"] == "中国"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_search_without_language_variant(self, mock_get):
         """Test that search method doesn't include variant parameter for standard languages."""
         # Setup mock response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "China",
-                        "snippet": "Test snippet",
-                        "pageid": 123,
-                        "wordcount": 1000,
-                        "timestamp": "2024-01-01T00:00:00Z",
-                    }
-                ]
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "search": [
+                        {
+                            "title": "China",
+                            "snippet": "Test snippet",
+                            "pageid": 123,
+                            "wordcount": 1000,
+                            "timestamp": "2024-01-01T00:00:00Z",
+                        }
+                    ]
+                }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         # Test search with standard language
@@ -202,7 +207,7 @@ class TestLanguageVariantAPIIntegration:
         assert params["srsearch"] == "China"
 
         # Ensure returned results are forwarded to the caller unchanged
-        assert results == mock_response.json.return_value["query"]["search"]
+        assert results == json.loads(mock_response.content)["query"]["search"]
 
 
 class TestServerIntegrationWithVariants:
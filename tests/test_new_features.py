@@ -2,13 +2,16 @@
 Tests for new features: configurable port and caching.
 """
 
+import json
+import gc
 import subprocess
 import time
 import requests
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock
 import functools
-from wikipedia_mcp.wikipedia_client import WikipediaClient
+import weakref
+from wikipedia_mcp.wikipedia_client import WikipediaClient, _ClientKey
 from wikipedia_mcp.server import create_server
 import sys
 
@@ -182,29 +185,32 @@ class TestCachingFunctionality:
         assert hasattr(client.get_article, "cache_info")
         assert hasattr(client.get_summary, "cache_info")
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_cache_effectiveness(self, mock_get):
         """Test that caching actually works."""
         # Mock the API response
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "Test Article",
-                        "snippet": "Test snippet",
-                        "pageid": 123,
-                        "wordcount": 100,
-                        "timestamp": "2023-01-01T00:00:00Z",
-                    }
-                ]
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "search": [
+                        {
+                            "title": "Test Article",
+                            "snippet": "Test snippet",
+                            "pageid": 123,
+                            "wordcount": 100,
+                            "timestamp": "2023-01-01T00:00:00Z",
+                        }
+                    ]
+                }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
-        # Create client with caching
+        # Create client with caching; caches are shared module-wide, so start empty
         client = WikipediaClient(enable_cache=True)
+        client.search.cache_clear()
 
         # Call the same search twice
         result1 = client.search("test query")
@@ -221,6 +227,60 @@ class TestCachingFunctionality:
         assert cache_info.hits == 1
         assert cache_info.misses == 1
 
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_cache_shared_between_clients(self, mock_get):
+        """Clients with the same configuration share cached results without being kept alive."""
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps({"query": {"search": [{"title": "Shared", "pageid": 1}]}}).encode()
+        mock_get.return_value = mock_response
+
+        first = WikipediaClient(enable_cache=True)
+        first.search.cache_clear()
+        first.search("shared query")
+        first_ref = weakref.ref(first)
+        del first
+        gc.collect()
+
+        second = WikipediaClient(enable_cache=True)
+        assert second.search("shared query")[0]["title"] == "Shared"
+        assert mock_get.call_count == 1
+        assert first_ref() is None
+
+        other_language = WikipediaClient(language="de", enable_cache=True)
+        other_language.search("shared query")
+        assert mock_get.call_count == 2
+
+    def test_cache_key_of_collected_client_raises(self):
+        """A cache key whose client has been garbage collected raises instead of returning None."""
+        client = WikipediaClient(enable_cache=True)
+        key = _ClientKey(client)
+        assert key.client is client
+
+        del client
+        gc.collect()
+
+        with pytest.raises(ReferenceError):
+            key.client
+
+    def test_section_index_cached_across_sections(self):
+        """Summarizing several sections of one article fetches and indexes it once."""
+        client = WikipediaClient(enable_cache=True)
+        client._section_index.cache_clear()
+
+        history = Mock(title="History", text="History text.", sections=[])
+        usage = Mock(title="Usage", text="Usage text.", sections=[])
+        mock_page = Mock()
+        mock_page.exists.return_value = True
+        mock_page.sections = [history, usage]
+
+        with patch.object(client.wiki, "page", return_value=mock_page) as mock_wiki_page:
+            assert client.summarize_section("Indexed Page", "history") == "History text."
+            assert client.summarize_section("Indexed Page", "Usage") == "Usage text."
+
+        mock_wiki_page.assert_called_once_with("Indexed Page")
+        client._section_index.cache_clear()
+
     def test_cache_methods_coverage(self):
         """Test that all expected methods are cached when caching is enabled."""
         client = WikipediaClient(enable_cache=True)
@@ -3,10 +3,17 @@ Comprehensive tests for Wikipedia MCP server tools.
 """
 
 import asyncio
+import gc
+import json
+import logging
+import threading
+import weakref
+import httpx
 import pytest
 import requests
 from unittest.mock import Mock, patch, MagicMock
-from wikipedia_mcp.server import create_server
+from wikipedia_mcp import server as server_module
+from wikipedia_mcp.server import create_server, _get_client
 from wikipedia_mcp.wikipedia_client import WikipediaClient
 
 
@@ -17,25 +24,27 @@ class TestWikipediaClient:
         """Set up test fixtures."""
         self.client = WikipediaClient()
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_search_success(self, mock_get):
         """Test successful search operation."""
         # Mock API response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "query": {
-                "search": [
-                    {
-                        "title": "Python (programming language)",
-                        "snippet": "Python is a programming language",
-                        "pageid": 12345,
-                        "wordcount": 1000,
-                        "timestamp": "2023-01-01T00:00:00Z",
-                    }
-                ]
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "search": [
+                        {
+                            "title": "Python (programming language)",
+                            "snippet": "Python is a programming language",
+                            "pageid": 12345,
+                            "wordcount": 1000,
+                            "timestamp": "2023-01-01T00:00:00Z",
+                        }
+                    ]
+                }
             }
-        }
+        ).encode()
         mock_get.return_value = mock_response
 
         # Test search
@@ -48,14 +57,26 @@ class TestWikipediaClient:
         assert results[0]["pageid"] == 12345
         mock_get.assert_called_once()
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_search_failure(self, mock_get):
         """Test handling of search failures when exceptions occur."""
         mock_get.side_effect = Exception("API error")
         results = self.client.search("Python")
         assert results == []
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @pytest.mark.parametrize(
+        "error",
+        [requests.exceptions.Timeout("slow"), requests.exceptions.ConnectionError("down"), ValueError("bad json")],
+    )
+    def test_search_request_errors_logged_with_type(self, error, caplog):
+        """Request and decode failures return no results and log the exception type."""
+        with patch("wikipedia_mcp.wikipedia_client.requests.Session.get", side_effect=error):
+            results = self.client.search("Python")
+
+        assert results == []
+        assert f"{type(error).__name__} when searching for 'Python'" in caplog.text
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_search_empty_query(self, mock_get):
         """Empty queries should not trigger HTTP calls."""
         results = self.client.search("")
@@ -66,64 +87,140 @@ class TestWikipediaClient:
         assert results == []
         mock_get.assert_not_called()
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_search_limit_validation(self, mock_get):
         """Ensure the limit is bounded within API constraints."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"query": {"search": []}}
+        mock_response.content = json.dumps({"query": {"search": []}}).encode()
         mock_get.return_value = mock_response
 
         self.client.search("Python", limit=1000)
         _, kwargs = mock_get.call_args
         assert kwargs["params"]["srlimit"] == 500
 
-    @patch("wikipedia_mcp.wikipedia_client.requests.get")
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
     def test_search_api_error(self, mock_get):
         """Handle API error payloads gracefully."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"error": {"code": "badquery", "info": "Invalid query"}}
+        mock_response.content = json.dumps({"error": {"code": "badquery", "info": "Invalid query"}}).encode()
         mock_get.return_value = mock_response
 
         results = self.client.search("Python")
         assert results == []
 
-    @patch("wikipedia_mcp.wikipedia_client.WikipediaClient._extract_sections")
-    def test_get_article_success(self, mock_extract_sections):
-        """Test successful article retrieval."""
-        # Mock Wikipedia page
-        mock_page = Mock()
-        mock_page.exists.return_value = True
-        mock_page.title = "Python (programming language)"
-        mock_page.pageid = 12345
-        mock_page.summary = "Python is a programming language"
-        mock_page.text = "Full article text here"
-        mock_page.fullurl = "https://en.wikipedia.org/wiki/Python_(programming_language)"
-        mock_page.categories = {"Category:Programming languages": None}
-        mock_page.links = {"Link1": None, "Link2": None}
-        mock_page.sections = []
-
-        mock_extract_sections.return_value = [{"title": "History", "level": 0, "text": "History text", "sections": []}]
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_connectivity_reports_end_to_end_time(self, mock_get):
+        """The reported response time is measured around the whole request."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {"query": {"general": {"sitename": "Wikipedia", "server": "//en.wikipedia.org"}}}
+        ).encode()
+
+        clock_ns = [0]
+
+        def slow_get(*args, **kwargs):
+            clock_ns[0] += 20_000_000
+            return mock_response
+
+        mock_get.side_effect = slow_get
+
+        with patch("wikipedia_mcp.wikipedia_client.time.perf_counter_ns", side_effect=lambda: clock_ns[0]):
+            result = self.client.test_connectivity()
+
+        assert result["status"] == "success"
+        assert result["site_name"] == "Wikipedia"
+        assert result["response_time_ms"] == 20
+
+    def test_session_pools_connections_and_retries(self):
+        """API calls share one pooled session that retries transient failures."""
+        assert self.client._session.headers["User-Agent"] == self.client.user_agent
+        assert "gzip" in self.client._session.headers["Accept-Encoding"]
+        assert self.client._session.headers["Accept"] == "application/json"
+
+        adapter = self.client._session.get_adapter(self.client.api_url)
+        assert adapter._pool_maxsize == 32
+        assert self.client._session.get_adapter("http://example.org") is adapter
+        assert adapter.max_retries.total == 5
+        assert adapter.max_retries.read == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.respect_retry_after_header
+        assert adapter.max_retries.raise_on_status is False
+
+        with patch.object(self.client._session, "close") as mock_close:
+            self.client.close()
+        mock_close.assert_called_once()
+
+    def test_context_manager_closes_session_and_applies_timeout(self):
+        """The client closes its session on exit and passes its timeout to every request."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps({"query": {"pages": {"1": {"pageid": 1, "title": "Test"}}}}).encode()
+
+        client = WikipediaClient(timeout=5)
+        with (
+            patch.object(client._session, "get", return_value=mock_response) as mock_get,
+            patch.object(client._session, "close") as mock_close,
+        ):
+            with client as entered:
+                assert entered is client
+                client.get_coordinates("Test")
+            mock_close.assert_called_once()
+
+        assert mock_get.call_args[1]["timeout"] == 5
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_article_success(self, mock_get):
+        """Text, sections, categories, links and URL come from one API request."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "pages": {
+                        "12345": {
+                            "pageid": 12345,
+                            "title": "Python (programming language)",
+                            "extract": "Python is a programming language.\n\n\n== History ==\nHistory text.",
+                            "fullurl": "https://en.wikipedia.org/wiki/Python_(programming_language)",
+                            "categories": [{"ns": 14, "title": "Category:Programming languages"}],
+                            "links": [{"ns": 0, "title": f"Link{i}"} for i in range(150)],
+                        }
+                    }
+                }
+            }
+        ).encode()
+        mock_get.return_value = mock_response
 
-        with patch.object(self.client.wiki, "page", return_value=mock_page):
-            article = self.client.get_article("Python (programming language)")
+        article = self.client.get_article("Python (programming language)")
 
+        mock_get.assert_called_once()
+        params = mock_get.call_args[1]["params"]
+        assert params["prop"] == "extracts|links|categories|info"
         assert article["exists"] is True
         assert article["title"] == "Python (programming language)"
         assert article["pageid"] == 12345
-        assert article["summary"] == "Python is a programming language"
-        assert article["text"] == "Full article text here"
-        assert len(article["categories"]) == 1
-        assert len(article["links"]) == 2
-
-    def test_get_article_not_found(self):
+        assert article["summary"] == "Python is a programming language."
+        assert article["text"] == "Python is a programming language.\n\nHistory\nHistory text."
+        assert article["url"] == "https://en.wikipedia.org/wiki/Python_(programming_language)"
+        assert article["sections"] == [{"title": "History", "level": 0, "text": "History text.", "sections": []}]
+        assert article["categories"] == ["Category:Programming languages"]
+        assert len(article["links"]) == 100
+        assert article["links"][0] == "Link0"
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_article_not_found(self, mock_get):
         """Test article retrieval for non-existent page."""
-        mock_page = Mock()
-        mock_page.exists.return_value = False
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {"query": {"pages": {"-1": {"ns": 0, "title": "NonExistentPage", "missing": ""}}}}
+        ).encode()
+        mock_get.return_value = mock_response
 
-        with patch.object(self.client.wiki, "page", return_value=mock_page):
-            article = self.client.get_article("NonExistentPage")
+        article = self.client.get_article("NonExistentPage")
 
         assert article["exists"] is False
         assert article["error"] == "Page does not exist"
@@ -203,27 +300,125 @@ class TestWikipediaClient:
         assert links == []
 
     def test_get_related_topics_success(self):
-        """Test successful related topics retrieval."""
+        """Link summaries are fetched in one batched extracts query; missing and invalid pages are skipped."""
         mock_page = Mock()
         mock_page.exists.return_value = True
-        mock_page.links = {"Related Link 1": None, "Related Link 2": None}
+        mock_page.links = {"Related Link 1": None, "Related Link 2": None, "Missing Link": None, "Bad<Link>": None}
         mock_page.categories = {"Category:Test Category": None}
 
-        # Mock related page
-        mock_related_page = Mock()
-        mock_related_page.exists.return_value = True
-        mock_related_page.summary = "Summary of related page"
-        mock_related_page.fullurl = "https://en.wikipedia.org/wiki/Related_Link_1"
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "redirects": [{"from": "Related Link 2", "to": "Redirect Target"}],
+                    "pages": {
+                        "1": {
+                            "pageid": 1,
+                            "title": "Related Link 1",
+                            "extract": "x" * 250,
+                            "fullurl": "https://en.wikipedia.org/wiki/Related_Link_1",
+                        },
+                        "2": {
+                            "pageid": 2,
+                            "title": "Redirect Target",
+                            "extract": "Summary of redirect target",
+                            "fullurl": "https://en.wikipedia.org/wiki/Redirect_Target",
+                        },
+                        "-1": {"title": "Missing Link", "missing": ""},
+                        "-2": {
+                            "title": "Bad<Link>",
+                            "invalid": "",
+                            "invalidreason": "The requested page title is invalid.",
+                        },
+                    },
+                }
+            }
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+
+        with (
+            patch.object(self.client.wiki, "page", return_value=mock_page),
+            patch("wikipedia_mcp.wikipedia_client.requests.Session.get", return_value=mock_response) as mock_get,
+        ):
+            related = self.client.get_related_topics("Test Page", limit=5)
 
-        with patch.object(self.client.wiki, "page") as mock_wiki_page:
-            mock_wiki_page.side_effect = lambda title: (
-                mock_related_page if title in ["Related Link 1", "Related Link 2"] else mock_page
-            )
+        mock_get.assert_called_once()
+        params = mock_get.call_args[1]["params"]
+        assert params["prop"] == "extracts|info"
+        assert params["titles"] == "Related Link 1|Related Link 2|Missing Link|Bad<Link>"
+        assert related == [
+            {
+                "title": "Related Link 1",
+                "summary": "x" * 200 + "...",
+                "url": "https://en.wikipedia.org/wiki/Related_Link_1",
+                "type": "link",
+            },
+            {
+                "title": "Related Link 2",
+                "summary": "Summary of redirect target",
+                "url": "https://en.wikipedia.org/wiki/Redirect_Target",
+                "type": "link",
+            },
+            {"title": "Test Category", "type": "category"},
+        ]
+
+    def test_describe_links_fetches_batches_concurrently(self):
+        """More than one batch of links is fetched in parallel and keeps link order."""
+        links = [f"Link {i}" for i in range(50)]
+        # Every batch waits for the others, so sequential fetching breaks the barrier
+        all_batches_started = threading.Barrier(3, timeout=5)
+
+        def fake_query_pages(params, aliases):
+            all_batches_started.wait()
+            titles = params["titles"].split("|")
+            return {str(i): {"pageid": i, "title": t, "extract": t, "fullurl": ""} for i, t in enumerate(titles)}
+
+        with patch.object(self.client, "_query_pages", side_effect=fake_query_pages) as mock_query:
+            related = self.client._describe_links(links, limit=50)
 
-            related = self.client.get_related_topics("Test Page", limit=3)
+        assert mock_query.call_count == 3
+        assert sorted(len(call.args[0]["titles"].split("|")) for call in mock_query.call_args_list) == [10, 20, 20]
+        assert [entry["title"] for entry in related] == links
+
+    @pytest.mark.asyncio
+    async def test_get_related_topics_async(self):
+        """The async variant returns the same topics from a worker thread."""
+        mock_page = Mock()
+        mock_page.links = {"Related Link 1": None}
+        mock_page.categories = {"Category:Test Category": None}
+
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "pages": {
+                        "1": {
+                            "pageid": 1,
+                            "title": "Related Link 1",
+                            "extract": "Summary of related page",
+                            "fullurl": "https://en.wikipedia.org/wiki/Related_Link_1",
+                        }
+                    }
+                }
+            }
+        ).encode()
+        mock_response.raise_for_status.return_value = None
 
-        assert len(related) >= 1
-        assert any(topic["type"] == "link" for topic in related)
+        with (
+            patch.object(self.client.wiki, "page", return_value=mock_page),
+            patch("wikipedia_mcp.wikipedia_client.requests.Session.get", return_value=mock_response),
+        ):
+            related = await self.client.get_related_topics_async("Test Page", limit=2)
+
+        assert related == [
+            {
+                "title": "Related Link 1",
+                "summary": "Summary of related page",
+                "url": "https://en.wikipedia.org/wiki/Related_Link_1",
+                "type": "link",
+            },
+            {"title": "Test Category", "type": "category"},
+        ]
 
     def test_get_related_topics_not_found(self):
         """Test related topics retrieval for non-existent page."""
@@ -258,6 +453,367 @@ class TestWikipediaClient:
         assert sections[0]["sections"][0]["title"] == "Subsection"
         assert sections[0]["sections"][0]["level"] == 1
 
+    def test_extract_sections_order_and_depth(self):
+        """Sections keep document order and deep nesting does not hit the recursion limit."""
+        leaf = Mock(title="Leaf", text="", sections=[])
+        for depth in range(2000):
+            leaf = Mock(title=f"Level {depth}", text="", sections=[leaf])
+        first = Mock(title="First", text="a", sections=[Mock(title="First.1", text="b", sections=[])])
+        second = Mock(title="Second", text="c", sections=[])
+
+        sections = self.client._extract_sections([first, second, leaf])
+
+        assert [section["title"] for section in sections] == ["First", "Second", "Level 1999"]
+        assert sections[0]["sections"][0]["title"] == "First.1"
+        assert sections[1]["sections"] == []
+
+        deepest = sections[2]
+        while deepest["sections"]:
+            deepest = deepest["sections"][0]
+        assert deepest["title"] == "Leaf"
+        assert deepest["level"] == 2000
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_article_bundle_single_request(self, mock_get):
+        """Sections, links and coordinates are fetched with one API request."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "pages": {
+                        "123": {
+                            "pageid": 123,
+                            "title": "Test Page",
+                            "extract": (
+                                "Intro.\n\n== History ==\nHistory text.\n\n"
+                                "=== Early ===\nEarly text.\n\n== Usage ==\nUsage text."
+                            ),
+                            "links": [{"ns": 0, "title": "Link1"}, {"ns": 0, "title": "Link2"}],
+                            "coordinates": [{"lat": 1.5, "lon": 2.5, "primary": True, "globe": "earth"}],
+                        }
+                    }
+                }
+            }
+        ).encode()
+        mock_get.return_value = mock_response
+
+        bundle = self.client.get_article_bundle("Test Page")
+
+        mock_get.assert_called_once()
+        params = mock_get.call_args[1]["params"]
+        assert params["prop"] == "extracts|links|coordinates"
+        assert params["formatversion"] == 2
+        assert params["coprop"] == "type|name|region|country|globe"
+        assert params["colimit"] == "max"
+        assert bundle["exists"] is True
+        assert bundle["links"] == ["Link1", "Link2"]
+        assert bundle["coordinates"]["coordinates"][0]["latitude"] == 1.5
+        assert [section["title"] for section in bundle["sections"]] == ["History", "Usage"]
+        assert bundle["sections"][0]["text"] == "History text."
+        assert bundle["sections"][0]["sections"][0]["title"] == "Early"
+        assert bundle["sections"][0]["sections"][0]["level"] == 1
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_article_bundle_follows_continuation(self, mock_get):
+        """Links split across continuation batches are merged."""
+        first = Mock()
+        first.raise_for_status.return_value = None
+        first.content = json.dumps(
+            {
+                "continue": {"plcontinue": "123|0|Link2", "continue": "||"},
+                "query": {"pages": {"123": {"pageid": 123, "title": "Test Page", "links": [{"title": "Link1"}]}}},
+            }
+        ).encode()
+        second = Mock()
+        second.raise_for_status.return_value = None
+        second.content = json.dumps(
+            {
+                "query": {"pages": {"123": {"pageid": 123, "title": "Test Page", "links": [{"title": "Link2"}]}}},
+            }
+        ).encode()
+        mock_get.side_effect = [first, second]
+
+        bundle = self.client.get_article_bundle("Test Page", ("links",))
+
+        assert bundle["links"] == ["Link1", "Link2"]
+        assert "sections" not in bundle
+        assert mock_get.call_args[1]["params"]["plcontinue"] == "123|0|Link2"
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_article_bundle_follows_redirects(self, mock_get):
+        """Normalized and redirected titles resolve to the target article."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "normalized": [{"from": "uK", "to": "UK"}],
+                    "redirects": [{"from": "UK", "to": "United Kingdom"}],
+                    "pages": [
+                        {
+                            "pageid": 31717,
+                            "title": "United Kingdom",
+                            "links": [{"ns": 0, "title": "London"}],
+                        }
+                    ],
+                }
+            }
+        ).encode()
+        mock_get.return_value = mock_response
+
+        bundle = self.client.get_article_bundle("uK", ("links",))
+
+        assert mock_get.call_args[1]["params"]["redirects"] == 1
+        assert bundle["title"] == "United Kingdom"
+        assert bundle["exists"] is True
+        assert bundle["links"] == ["London"]
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_get_article_bundle_missing_page(self, mock_get):
+        """Missing pages yield empty aspects and a non-existent coordinates result."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps({"query": {"pages": {"-1": {"title": "Missing", "missing": ""}}}}).encode()
+        mock_get.return_value = mock_response
+
+        bundle = self.client.get_article_bundle("Missing")
+
+        assert bundle["exists"] is False
+        assert bundle["sections"] == []
+        assert bundle["links"] == []
+        assert bundle["coordinates"]["exists"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_article_bundle_async_uses_shared_http_client(self):
+        """The async bundle goes through the shared httpx client and closes with the last user."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "query": {"pages": {"123": {"pageid": 123, "title": "Test Page", "links": [{"title": "Link1"}]}}}
+                },
+            )
+
+        async with self.client:
+            http_client = self.client._get_async_http()
+            http_client._transport = httpx.MockTransport(handler)
+            bundle = await self.client.get_article_bundle_async("Test Page", ("links",))
+            assert self.client._get_async_http() is http_client
+
+        assert bundle["links"] == ["Link1"]
+        assert seen[0].url.params["prop"] == "links"
+        assert "gzip" in seen[0].headers["Accept-Encoding"]
+        assert seen[0].headers["Accept"] == "application/json"
+        assert seen[0].headers["User-Agent"] == self.client.user_agent
+        assert http_client.is_closed
+        assert not self.client._async_http
+
+    @pytest.mark.asyncio
+    async def test_async_http_client_per_event_loop(self):
+        """Another event loop gets its own async HTTP client, which aclose() closes on that loop."""
+
+        async def use_async_http():
+            try:
+                return self.client._get_async_http()
+            finally:
+                await self.client.aclose()
+
+        def run_in_temporary_loop():
+            return asyncio.run(use_async_http())
+
+        async with self.client:
+            http_client = self.client._get_async_http()
+            other = await asyncio.to_thread(run_in_temporary_loop)
+
+            assert other is not http_client
+            assert other.is_closed
+            assert self.client._get_async_http() is http_client
+            assert not http_client.is_closed
+
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_async_requests_retry_rate_limited_responses(self):
+        """429 responses are retried after Retry-After; other errors are raised."""
+        statuses = [429, 429, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            if status == 429:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"query": {"pages": {"1": {"pageid": 1, "title": "Test Page"}}}})
+
+        async with self.client:
+            self.client._get_async_http()._transport = httpx.MockTransport(handler)
+            with patch("wikipedia_mcp.wikipedia_client.asyncio.sleep", wraps=asyncio.sleep) as mock_sleep:
+                data = await self.client._get_async({"action": "query", "titles": "Test Page"})
+
+        assert data["query"]["pages"]["1"]["title"] == "Test Page"
+        assert statuses == []
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.0, 0.0]
+
+    def test_retry_delay_uses_retry_after_or_backoff(self):
+        """Retry-After is honoured (in seconds or as a date); otherwise the delay doubles up to a cap."""
+        from wikipedia_mcp.wikipedia_client import _retry_delay
+
+        assert _retry_delay("2", 0) == 2.0
+        assert _retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", 0) == 0.0
+        assert _retry_delay(None, 0) == 0.5
+        assert _retry_delay("soon", 2) == 2.0
+        assert _retry_delay(None, 10) == 30.0
+
+    @pytest.mark.asyncio
+    async def test_async_rate_limiter_spaces_requests_beyond_burst(self):
+        """Requests beyond the burst size wait for their token."""
+        from wikipedia_mcp.wikipedia_client import _AsyncRateLimiter
+
+        limiter = _AsyncRateLimiter(2)
+        with patch("wikipedia_mcp.wikipedia_client.asyncio.sleep") as mock_sleep:
+            for _ in range(4):
+                await limiter.acquire()
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert delays[0] == pytest.approx(0.5, abs=0.01)
+        assert delays[1] == pytest.approx(1.0, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_async_http_client_respects_use_http2(self):
+        """HTTP/2 can be turned off for the async client; connections are bounded."""
+        client = WikipediaClient(use_http2=False)
+
+        async with client:
+            pool = client._get_async_http()._transport._pool
+
+        assert client.use_http2 is False
+        assert pool._http2 is False
+        assert pool._max_keepalive_connections == 8
+        assert pool._max_connections == 32
+
+    @pytest.mark.asyncio
+    async def test_call_async_coalesces_concurrent_duplicates(self):
+        """Identical concurrent calls share one upstream request; different ones do not."""
+        calls = []
+        release = threading.Event()
+
+        def slow_summary(title):
+            calls.append(title)
+            release.wait(5)
+            return f"Summary of {title}"
+
+        with patch.object(self.client, "get_summary", side_effect=slow_summary):
+            pending = [
+                asyncio.ensure_future(self.client.call_async("get_summary", "Python")),
+                asyncio.ensure_future(self.client.call_async("get_summary", "Python")),
+                asyncio.ensure_future(self.client.call_async("get_summary", "Java")),
+            ]
+            # Let every caller join or start its call before any of them finishes
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending)
+
+        assert results == ["Summary of Python", "Summary of Python", "Summary of Java"]
+        assert sorted(calls) == ["Java", "Python"]
+        assert self.client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_call_async_shares_exceptions(self):
+        """Waiters of a failed in-flight call see the same exception."""
+
+        release = threading.Event()
+
+        def failing(title):
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        with patch.object(self.client, "get_summary", side_effect=failing) as mock_summary:
+            pending = [
+                asyncio.ensure_future(self.client.call_async("get_summary", "Python")),
+                asyncio.ensure_future(self.client.call_async("get_summary", "Python")),
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending, return_exceptions=True)
+
+        mock_summary.assert_called_once_with("Python")
+
+        assert [str(result) for result in results] == ["boom", "boom"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Cancelling the caller that started a shared call leaves it running for the others."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = []
+
+        async def upstream():
+            calls.append("upstream")
+            started.set()
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(self.client._singleflight(("get_summary", "Python"), upstream))
+        await started.wait()
+        second = asyncio.create_task(self.client._singleflight(("get_summary", "Python"), upstream))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+
+        assert await second == "result"
+        assert calls == ["upstream"]
+        assert self.client._inflight == {}
+
+    @patch("wikipedia_mcp.wikipedia_client.requests.Session.get")
+    def test_summarize_for_query_uses_search_snippet(self, mock_get):
+        """The search index's match snippet is returned without fetching the article."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(
+            {
+                "query": {
+                    "search": [
+                        {
+                            "title": "Test Page",
+                            "snippet": 'About a specific <span class="searchmatch">keyword</span> &amp; more',
+                        }
+                    ]
+                }
+            }
+        ).encode()
+        mock_get.return_value = mock_response
+
+        with patch.object(self.client.wiki, "page") as mock_wiki_page:
+            summary = self.client.summarize_for_query("Test Page", "keyword", max_length=20)
+
+        mock_wiki_page.assert_not_called()
+        assert summary == "About a specific key..."
+        params = mock_get.call_args[1]["params"]
+        assert params["srsearch"] == '"keyword" intitle:"Test Page"'
+        assert params["srlimit"] == 1
+
+    def test_summarize_for_query_falls_back_to_article_text(self):
+        """Without a matching search hit the snippet is cut from the article text."""
+        mock_page = Mock()
+        mock_page.exists.return_value = True
+        mock_page.text = "Some text mentioning a keyword in passing."
+        mock_page.summary = "Summary."
+        other_hit = {"title": "Other Page", "snippet": "keyword elsewhere"}
+
+        with (
+            patch.object(self.client.wiki, "page", return_value=mock_page),
+            patch.object(self.client, "search", return_value=[other_hit]),
+        ):
+            summary = self.client.summarize_for_query("Test Page", "keyword", max_length=100)
+
+        assert summary == "Some text mentioning a keyword in passing."
+
     def test_summarize_for_query_success(self):
         """Test successful query-focused summary retrieval."""
         mock_page = Mock()
@@ -268,12 +824,31 @@ class TestWikipediaClient:
         )
         mock_page.summary = "This is a general summary."
 
-        with patch.object(self.client.wiki, "page", return_value=mock_page):
+        with (
+            patch.object(self.client.wiki, "page", return_value=mock_page),
+            patch.object(self.client, "search", return_value=[]),
+        ):
             summary = self.client.summarize_for_query("Test Page", "keyword", max_length=50)
 
         assert "keyword" in summary
         assert len(summary) <= 50 + 3  # for "..."
 
+    @pytest.mark.asyncio
+    async def test_summarize_for_query_sync_wrapper_inside_event_loop(self):
+        """The synchronous wrapper also works when called from a running event loop."""
+        mock_page = Mock()
+        mock_page.exists.return_value = True
+        mock_page.text = "Some text mentioning a keyword in passing."
+        mock_page.summary = "Summary."
+
+        with (
+            patch.object(self.client.wiki, "page", return_value=mock_page),
+            patch.object(self.client, "search", return_value=[]),
+        ):
+            summary = self.client.summarize_for_query("Test Page", "keyword", max_length=100)
+
+        assert "keyword" in summary
+
     def test_summarize_for_query_not_found(self):
         """Test query-focused summary when query is not in text."""
         mock_page = Mock()
@@ -282,7 +857,10 @@ class TestWikipediaClient:
         mock_page.text = "This is some other text."
         mock_page.summary = "A general summary content."
 
-        with patch.object(self.client.wiki, "page", return_value=mock_page):
+        with (
+            patch.object(self.client.wiki, "page", return_value=mock_page),
+            patch.object(self.client, "search", return_value=[]),
+        ):
             summary = self.client.summarize_for_query("Test Page", "missing_keyword", max_length=30)
 
         assert "A general summary content."[:30] in summary  # Should return start of summary
@@ -291,7 +869,10 @@ class TestWikipediaClient:
         """Test query-focused summary when page does not exist."""
         mock_page = Mock()
         mock_page.exists.return_value = False
-        with patch.object(self.client.wiki, "page", return_value=mock_page):
+        with (
+            patch.object(self.client.wiki, "page", return_value=mock_page),
+            patch.object(self.client, "search", return_value=[]),
+        ):
             summary = self.client.summarize_for_query("NonExistent Page", "keyword")
         assert "No Wikipedia article found for 'NonExistent Page'" in summary
 
@@ -313,6 +894,21 @@ class TestWikipediaClient:
         assert summary == "This is the text of ..."
         assert len(summary) <= 20 + 3
 
+    def test_summarize_section_matches_nested_title_any_case(self):
+        """Subsections are searched in document order and titles match case-insensitively."""
+        nested = Mock(title="Early Life", text="Born in a small town.", sections=[])
+        later = Mock(title="early life", text="Duplicate title further down.", sections=[])
+        parent = Mock(title="Biography", text="", sections=[nested])
+
+        mock_page = Mock()
+        mock_page.exists.return_value = True
+        mock_page.sections = [parent, later]
+
+        with patch.object(self.client.wiki, "page", return_value=mock_page):
+            summary = self.client.summarize_section("Test Page", "EARLY LIFE")
+
+        assert summary == "Born in a small town."
+
     def test_summarize_section_not_found(self):
         """Test section summary when section does not exist."""
         mock_other_section = Mock()
@@ -353,6 +949,30 @@ class TestWikipediaClient:
         assert facts[1] == "Fact two."
         assert facts[2] == "Fact three."
 
+    def test_extract_facts_skips_empty_sentences(self):
+        """Empty fragments between periods are skipped without counting towards the limit."""
+        mock_page = Mock()
+        mock_page.exists.return_value = True
+        mock_page.summary = "  First.. Second ...Third. Fourth"
+        mock_page.sections = []
+
+        with patch.object(self.client.wiki, "page", return_value=mock_page):
+            facts = self.client.extract_facts("Test Page", count=4)
+
+        assert facts == ["First.", "Second.", "Third.", "Fourth."]
+
+    def test_extract_facts_sentence_boundaries(self):
+        """Sentences also end at "!" and "?", but not at decimal points."""
+        mock_page = Mock()
+        mock_page.exists.return_value = True
+        mock_page.summary = "Pi is about 3.14 in value! Is it rational? No. Never read"
+        mock_page.sections = []
+
+        with patch.object(self.client.wiki, "page", return_value=mock_page):
+            facts = self.client.extract_facts("Test Page", count=3)
+
+        assert facts == ["Pi is about 3.14 in value!", "Is it rational?", "No."]
+
     def test_extract_facts_success_from_section(self):
         """Test successful fact extraction from a specific section."""
         mock_target_section = Mock()
@@ -416,6 +1036,8 @@ class TestMCPServerTools:
     def setup_method(self):
         """Set up test fixtures."""
         self.server = create_server()
+        # Let tests that patch WikipediaClient see a fresh client being created
+        _get_client.cache_clear()
 
     @patch("wikipedia_mcp.server.WikipediaClient")
     def test_create_server_with_language(self, MockWikipediaClient):
@@ -490,6 +1112,181 @@ class TestMCPServerTools:
         tool_names = asyncio.run(gather_tools())
         assert "test_wikipedia_connectivity" in tool_names
 
+    def test_get_client_is_shared_per_configuration(self):
+        """Servers with the same configuration share one WikipediaClient."""
+        client = _get_client("en", None, False, None)
+        assert _get_client("en", None, False, None) is client
+        assert _get_client("en", None, True, None) is not client
+        assert _get_client("ja", None, False, None) is not client
+
+    def test_create_server_uses_requested_language(self):
+        """Each server gets a client for its own language or country."""
+        with patch.object(WikipediaClient, "close") as mock_close:
+            ja_client = _get_client("ja", None, False, None)
+            tw_client = _get_client("en", "TW", False, None)
+            assert ja_client.base_language == "ja"
+            assert tw_client.base_language == "zh"
+
+            # Clients are tracked weakly and closed at exit
+            assert ja_client in server_module._CLIENTS
+            server_module._close_clients()
+            assert mock_close.call_count >= 2
+
+            # ...without being kept alive once evicted from the cache
+            ja_ref = weakref.ref(ja_client)
+            _get_client.cache_clear()
+            del ja_client, tw_client
+            gc.collect()
+            assert ja_ref() is None
+
+    @pytest.mark.asyncio
+    async def test_search_wikipedia_rejects_out_of_range_limit(self):
+        """Out-of-range limits are rejected during argument validation."""
+        tool = await self.server.get_tool("search_wikipedia")
+
+        with pytest.raises(Exception):
+            await tool.run({"query": "Python", "limit": 0})
+        with pytest.raises(Exception):
+            await tool.run({"query": "Python", "limit": 501})
+
+    @pytest.mark.asyncio
+    async def test_search_wikipedia_whitespace_query(self):
+        """Whitespace-only queries return an error response without searching."""
+        tool = await self.server.get_tool("search_wikipedia")
+        result = await tool.run({"query": "   "})
+
+        assert result.structured_content["status"] == "error"
+        assert result.structured_content["query"] == "   "
+        assert result.structured_content["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_resource_blank_query_skips_client(self):
+        """Blank queries are answered without touching the client."""
+        resource_fn = (await self.server.get_resource_templates())["/search/{query}"].fn
+        with patch.object(WikipediaClient, "call_async") as mock_call:
+            for query in ("", " \t\n"):
+                result = await resource_fn(query)
+                assert result["status"] == "error"
+                assert result["count"] == 0
+                assert result["results"] == []
+        mock_call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_blank_query_responses_are_copies(self):
+        """Blank-query responses are built from the module-level response without sharing state."""
+        resource_fn = (await self.server.get_resource_templates())["/search/{query}"].fn
+        first = await resource_fn(" ")
+        first["results"].append({"title": "Mutated"})
+        second = await resource_fn("")
+
+        assert second["results"] == []
+        assert second["query"] == ""
+        assert second["message"] == server_module._EMPTY_QUERY_RESPONSE["message"]
+        assert server_module._EMPTY_QUERY_RESPONSE["results"] == []
+
+    def test_uvloop_policy_installed_by_cli_only(self):
+        """Only the CLI switches to uvloop's event loop policy; create_server leaves it alone."""
+        from wikipedia_mcp.__main__ import _use_uvloop
+
+        class FakeUvloopPolicy(asyncio.DefaultEventLoopPolicy):
+            pass
+
+        original_policy = asyncio.get_event_loop_policy()
+        try:
+            with patch.dict("sys.modules", {"uvloop": Mock(EventLoopPolicy=FakeUvloopPolicy)}):
+                create_server()
+                assert asyncio.get_event_loop_policy() is original_policy
+
+                _use_uvloop()
+                assert isinstance(asyncio.get_event_loop_policy(), FakeUvloopPolicy)
+        finally:
+            asyncio.set_event_loop_policy(original_policy)
+
+    @pytest.mark.asyncio
+    async def test_handler_logs_escape_user_input(self, caplog):
+        """Handler log records quote user input so it stays on one line."""
+        caplog.set_level(logging.INFO, logger="wikipedia_mcp.server")
+        tool = await self.server.get_tool("get_summary")
+        with patch.object(WikipediaClient, "get_summary", return_value="A summary."):
+            await tool.run({"title": "Fake\nINFO forged record"})
+
+        messages = [record.getMessage() for record in caplog.records if record.name == "wikipedia_mcp.server"]
+        assert "Getting summary: title='Fake\\nINFO forged record'" in messages
+
+    @pytest.mark.asyncio
+    async def test_tool_results_serialize_to_json(self):
+        """Tool results are returned as JSON text matching the structured content."""
+        tool = await self.server.get_tool("search_wikipedia")
+        result = await tool.run({"query": "   "})
+
+        assert json.loads(result.content[0].text) == result.structured_content
+
+    @pytest.mark.asyncio
+    async def test_get_summary_tool_returns_typed_response(self):
+        """Fixed-shape tool results advertise an output schema and leave out unset keys."""
+        tool = await self.server.get_tool("get_summary")
+        assert set(tool.output_schema["properties"]) == {"title", "summary", "error"}
+
+        with patch.object(WikipediaClient, "get_summary", return_value="A summary."):
+            result = await tool.run({"title": "Uncached Summary Title"})
+
+        assert result.structured_content == {"title": "Uncached Summary Title", "summary": "A summary."}
+        assert json.loads(result.content[0].text) == result.structured_content
+
+    @pytest.mark.asyncio
+    async def test_get_coordinates_tool_uses_coordinates_lookup(self):
+        """The coordinates tool and resource use the dedicated coordinates request, not the bundle."""
+        expected = {"title": "Paris", "pageid": 1, "coordinates": None, "exists": True, "error": None}
+        tool = await self.server.get_tool("get_coordinates")
+        resource_fn = (await self.server.get_resource_templates())["/coordinates/{title}"].fn
+        with patch.object(WikipediaClient, "get_coordinates_async", return_value=expected) as mock_coordinates:
+            with patch.object(WikipediaClient, "get_article_bundle_async") as mock_bundle:
+                result = await tool.run({"title": "Paris"})
+                assert await resource_fn("Paris") == expected
+
+        assert result.structured_content == expected
+        assert mock_coordinates.call_count == 2
+        mock_bundle.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sections_and_links_tools_follow_redirects(self):
+        """get_sections and get_links report the target article of a redirect title."""
+        requests_seen = []
+
+        async def fake_get_async(self, params):
+            requests_seen.append(params)
+            return {
+                "query": {
+                    "redirects": [{"from": "UK", "to": "United Kingdom"}],
+                    "pages": [
+                        {
+                            "pageid": 31717,
+                            "title": "United Kingdom",
+                            "extract": "Intro.\n\n== History ==\nHistory text.",
+                            "links": [{"ns": 0, "title": "London"}],
+                        }
+                    ],
+                }
+            }
+
+        sections_tool = await self.server.get_tool("get_sections")
+        links_tool = await self.server.get_tool("get_links")
+        with patch.object(WikipediaClient, "_get_async", fake_get_async):
+            sections = await sections_tool.run({"title": "UK"})
+            links = await links_tool.run({"title": "UK"})
+
+        assert [params["redirects"] for params in requests_seen] == [1, 1]
+        assert [section["title"] for section in sections.structured_content["sections"]] == ["History"]
+        assert links.structured_content["links"] == ["London"]
+
+    @pytest.mark.asyncio
+    async def test_resource_templates_resolve(self):
+        """Templated resource URIs resolve to the matching resource template."""
+        resources = self.server._resource_manager
+        assert await resources.has_resource("/summary/Python/section/History/length/50")
+        assert await resources.has_resource("/bundle/Python")
+        assert not await resources.has_resource("/bundle/Python/extra")
+
 
 class TestIntegration:
     """Integration tests for the complete system."""
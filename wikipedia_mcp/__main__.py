@@ -5,6 +5,7 @@ configures logging, and then starts the Wikipedia MCP server.
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 import os
@@ -76,6 +77,22 @@ def _parse_locale_env() -> tuple[Optional[str], Optional[str]]:
     return preferred_language, preferred_country
 
 
+def _use_uvloop() -> None:
+    """
+    Run event loops started afterwards (e.g. by server.run()) on uvloop.
+
+    uvloop is an optional accelerator installed with the "fast" extra (not on
+    Windows); without it the default asyncio loop is kept. Only the CLI does
+    this, so importing the package never changes the process's loop policy.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover - depends on installed extras
+        return
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
     """Run the Wikipedia MCP server."""
 
@@ -282,6 +299,7 @@ def main() -> None:
         )
 
     # Finally, run the server with the chosen transport
+    _use_uvloop()
     if args.transport == "sse":
         logger.info("Starting SSE server on %s:%d", args.host, args.port)
         server.run(transport=args.transport, port=args.port, host=args.host)
@@ -6,15 +6,281 @@ interacting with Wikipedia via the WikipediaClient. It includes search,
 article retrieval, summaries, and diagnostics.
 """
 
+import atexit
+import contextlib
+import functools
 import logging
-from typing import Dict, Optional, Any, Annotated
-from pydantic import Field
+import weakref
+from dataclasses import dataclass
+from typing import Any, Annotated, AsyncIterator, Dict, List, Optional
+from pydantic import Field, WithJsonSchema
+from typing_extensions import NotRequired, TypedDict
 
 from fastmcp import FastMCP
 from wikipedia_mcp.wikipedia_client import WikipediaClient
 
+try:  # Optional accelerator, installed with the "fast" extra
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Integer bounds are enforced by pydantic-core when FastMCP validates tool
+# arguments, but kept out of the advertised schema: Google ADK rejects
+# parameters that combine a default with keywords such as minimum/maximum.
+_PLAIN_INTEGER_SCHEMA = WithJsonSchema({"type": "integer"})
+
+# Tool parameter definitions shared by every server instance
+_QUERY_FIELD = Field(min_length=1)
+_SEARCH_LIMIT_FIELD = Field(ge=1, le=500)
+_POSITIVE_INT_FIELD = Field(ge=1)
+_MAX_LENGTH_FIELD = Field(title="Max Length", ge=1)
+_TOPIC_FIELD = Field(title="Topic Within Article")
+
+_NO_RESULTS_MESSAGE = (
+    "No search results found. This could indicate connectivity issues, API errors, or simply no matching articles."
+)
+
+
+# ----------------------------------------------------------------------
+# Response types
+#
+# Slotted dataclasses for the fixed-shape responses built by this module.
+# They are serialized directly (orjson and pydantic both handle dataclasses)
+# and give clients a precise output schema. Responses with keys that are only
+# present in some cases are TypedDicts instead, so that unset keys are left
+# out rather than sent as null. Article, coordinate, bundle and connectivity
+# results are passed through from WikipediaClient as dicts.
+# ----------------------------------------------------------------------
+
+
+class SearchResponse(TypedDict):
+    query: str
+    results: List[Dict[str, Any]]
+    status: str
+    count: int
+    language: str
+    message: NotRequired[str]
+
+
+# Blank-query search response; handlers fill in the per-call fields on a copy
+_EMPTY_QUERY_RESPONSE: SearchResponse = {
+    "query": "",
+    "results": [],
+    "status": "error",
+    "count": 0,
+    "language": "",
+    "message": "Empty search query provided",
+}
+
+
+class SummaryResponse(TypedDict):
+    title: str
+    summary: Optional[str]
+    error: NotRequired[str]
+
+
+@dataclass(slots=True)
+class QuerySummaryResponse:
+    title: str
+    query: str
+    summary: str
+
+
+@dataclass(slots=True)
+class SectionSummaryResponse:
+    title: str
+    section_title: str
+    summary: str
+
+
+@dataclass(slots=True)
+class KeyFactsResponse:
+    title: str
+    topic_within_article: str
+    facts: List[str]
+
+
+@dataclass(slots=True)
+class RelatedTopicsResponse:
+    title: str
+    related_topics: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class SectionsResponse:
+    title: str
+    sections: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class LinksResponse:
+    title: str
+    links: List[str]
+
+
+def _orjson_serializer(data: Any) -> str:
+    """Serialize a tool result to JSON text with orjson."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Clients created by _get_client; closed at exit unless already collected.
+# Held weakly so that clients evicted from the cache can be freed.
+_CLIENTS: "weakref.WeakSet[WikipediaClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close the HTTP connections of every client that is still alive."""
+    for client in list(_CLIENTS):
+        client.close()
+
+
+@functools.lru_cache(maxsize=16)
+def _get_client(
+    language: str,
+    country: Optional[str],
+    enable_cache: bool,
+    access_token: Optional[str],
+) -> WikipediaClient:
+    """
+    Return a process-wide WikipediaClient for the given configuration.
+
+    Servers created with the same settings share one client, and with it the
+    underlying HTTP connection pool and any enabled caches.
+    """
+    client = WikipediaClient(
+        language=language,
+        country=country,
+        enable_cache=enable_cache,
+        access_token=access_token,
+    )
+    _CLIENTS.add(client)
+    return client
+
+
+# ----------------------------------------------------------------------
+# Shared handler implementations
+#
+# Each tool and its matching resource are thin wrappers around one of these
+# functions, so both paths share the same logging, validation and caching.
+# Log calls pass user input as %r arguments: formatting (including repr) is
+# deferred until a handler accepts the record, and quotes/escapes keep
+# titles with spaces or newlines unambiguous on one log line.
+# Client calls go through WikipediaClient.call_async (or the native async
+# bundle API), which keeps blocking I/O off the event loop and coalesces
+# identical concurrent requests.
+# ----------------------------------------------------------------------
+
+
+async def _do_search(client: WikipediaClient, query: str, limit: int) -> SearchResponse:
+    """Search Wikipedia and wrap the results with status metadata."""
+    # Checked before any other work so that floods of blank queries cost one
+    # string test, a copy of the module-level response and a single log
+    # record each.
+    if not query or query.isspace():
+        logger.warning("Search called with empty query")
+        return {**_EMPTY_QUERY_RESPONSE, "query": query, "results": [], "language": client.base_language}
+
+    logger.info("Searching Wikipedia: query=%r limit=%d", query, limit)
+    results = await client.call_async("search", query, limit)
+    if results:
+        return SearchResponse(
+            query=query, results=results, status="success", count=len(results), language=client.base_language
+        )
+    return SearchResponse(
+        query=query,
+        results=results,
+        status="no_results",
+        count=0,
+        language=client.base_language,
+        message=_NO_RESULTS_MESSAGE,
+    )
+
+
+async def _do_get_article(client: WikipediaClient, title: str) -> Dict[str, Any]:
+    """Fetch a full article, always returning a dictionary."""
+    logger.info("Getting article: title=%r", title)
+    article = await client.call_async("get_article", title)
+    return article or {"title": title, "exists": False, "error": "Unknown error retrieving article"}
+
+
+async def _do_get_summary(client: WikipediaClient, title: str) -> SummaryResponse:
+    """Fetch an article summary, reporting client errors under "error"."""
+    logger.info("Getting summary: title=%r", title)
+    summary = await client.call_async("get_summary", title)
+    if summary and not summary.startswith("Error"):
+        return SummaryResponse(title=title, summary=summary)
+    return SummaryResponse(title=title, summary=None, error=summary)
+
+
+async def _do_summarize_for_query(
+    client: WikipediaClient, title: str, query: str, max_length: int
+) -> QuerySummaryResponse:
+    """Build a query-focused summary of an article."""
+    logger.info("Getting query-focused summary: title=%r query=%r max_length=%d", title, query, max_length)
+    summary = await client.call_async("summarize_for_query", title, query, max_length)
+    return QuerySummaryResponse(title, query, summary)
+
+
+async def _do_summarize_section(
+    client: WikipediaClient, title: str, section_title: str, max_length: int
+) -> SectionSummaryResponse:
+    """Summarize one section of an article."""
+    logger.info("Getting section summary: title=%r section_title=%r max_length=%d", title, section_title, max_length)
+    summary = await client.call_async("summarize_section", title, section_title, max_length)
+    return SectionSummaryResponse(title, section_title, summary)
+
+
+async def _do_extract_facts(
+    client: WikipediaClient, title: str, topic_within_article: str, count: int
+) -> KeyFactsResponse:
+    """
+    Extract key facts from an article.
+
+    The topic is stripped of surrounding whitespace, so "  Foo " and "Foo"
+    share a cache entry; a blank topic means no topic.
+    """
+    logger.info("Extracting key facts: title=%r topic=%r count=%d", title, topic_within_article, count)
+    topic = topic_within_article.strip() or None
+    facts = await client.call_async("extract_facts", title, topic, count)
+    return KeyFactsResponse(title, topic or "", facts)
+
+
+async def _do_get_related_topics(client: WikipediaClient, title: str, limit: int) -> RelatedTopicsResponse:
+    """Collect topics related to an article."""
+    logger.info("Getting related topics: title=%r limit=%d", title, limit)
+    related = await client.call_async("get_related_topics", title, limit)
+    return RelatedTopicsResponse(title, related)
+
+
+async def _do_get_sections(client: WikipediaClient, title: str) -> SectionsResponse:
+    """List the sections of an article."""
+    logger.info("Getting sections: title=%r", title)
+    bundle = await client.get_article_bundle_async(title, ("sections",))
+    return SectionsResponse(title, bundle["sections"])
+
+
+async def _do_get_links(client: WikipediaClient, title: str) -> LinksResponse:
+    """List the links of an article."""
+    logger.info("Getting links: title=%r", title)
+    bundle = await client.get_article_bundle_async(title, ("links",))
+    return LinksResponse(title, bundle["links"])
+
+
+async def _do_get_coordinates(client: WikipediaClient, title: str) -> Dict[str, Any]:
+    """Look up the coordinates of an article."""
+    logger.info("Getting coordinates: title=%r", title)
+    return await client.get_coordinates_async(title)
+
+
+async def _do_get_article_bundle(client: WikipediaClient, title: str, include: str) -> Dict[str, Any]:
+    """Fetch the comma-separated aspects in ``include`` with one API request."""
+    logger.info("Getting article bundle: title=%r include=%r", title, include)
+    parts = tuple(part.strip() for part in include.split(",") if part.strip())
+    return await client.get_article_bundle_async(title, parts)
+
 
 def create_server(
     language: str = "en",
@@ -24,23 +290,35 @@ def create_server(
 ) -> FastMCP:
     """Create and configure the Wikipedia MCP server."""
 
-    server = FastMCP(
-        name="Wikipedia",
-    )
-
-    # Initialize Wikipedia client
-    wikipedia_client = WikipediaClient(
-        language="ko",
-        country="South Korea",
+    # Initialize (or reuse) the Wikipedia client
+    wikipedia_client = _get_client(
+        language=language,
+        country=country,
         enable_cache=enable_cache,
         access_token=access_token,
     )
 
+    @contextlib.asynccontextmanager
+    async def lifespan(_server: FastMCP) -> AsyncIterator[None]:
+        # Closes the client's shared async HTTP connections on shutdown
+        async with wikipedia_client:
+            yield
+
+    server = FastMCP(
+        name="Wikipedia",
+        lifespan=lifespan,
+        # None keeps FastMCP's default pydantic-based serializer
+        tool_serializer=_orjson_serializer if orjson is not None else None,
+    )
+
     # ------------------------------------------------------------------
     # Tool: search_wikipedia
     # ------------------------------------------------------------------
     @server.tool()
-    def search_wikipedia(query: str, limit: int = 10) -> Dict[str, Any]:
+    async def search_wikipedia(
+        query: Annotated[str, _QUERY_FIELD],
+        limit: Annotated[int, _SEARCH_LIMIT_FIELD, _PLAIN_INTEGER_SCHEMA] = 10,
+    ) -> SearchResponse:
         """
         Search Wikipedia for articles matching a query.
 
@@ -49,53 +327,17 @@ def create_server(
             limit: Maximum number of results to return (1-500).
 
         Returns a dictionary with the search query, results, status, and
-        additional metadata. If the query is empty or invalid, the status
-        will be 'error' and an explanatory message is included.
-        """
-        logger.info("Tool: Searching Wikipedia for '%s' (limit=%d)", query, limit)
-
-        # Validate query
-        if not query or not query.strip():
-            logger.warning("Search tool called with empty query")
-            return {
-                "query": query,
-                "results": [],
-                "status": "error",
-                "message": "Empty search query provided",
-            }
-
-        # Sanitize and validate limit
-        validated_limit = limit
-        if limit <= 0:
-            validated_limit = 10
-            logger.warning("Invalid limit %d; using default %d", limit, validated_limit)
-        elif limit > 500:
-            validated_limit = 500
-            logger.warning("Limit %d capped to %d", limit, validated_limit)
-
-        results = wikipedia_client.search(query, limit=validated_limit)
-        status = "success" if results else "no_results"
-        response: Dict[str, Any] = {
-            "query": query,
-            "results": results,
-            "status": status,
-            "count": len(results),
-            "language": wikipedia_client.base_language,
-        }
-
-        if not results:
-            response["message"] = (
-                "No search results found. This could indicate connectivity issues, "
-                "API errors, or simply no matching articles."
-            )
-
-        return response
+        additional metadata. Empty queries and out-of-range limits are
+        rejected during argument validation; a whitespace-only query yields
+        status 'error' with an explanatory message.
+        """
+        return await _do_search(wikipedia_client, query, limit)
 
     # ------------------------------------------------------------------
     # Tool: test_wikipedia_connectivity
     # ------------------------------------------------------------------
     @server.tool()
-    def test_wikipedia_connectivity() -> Dict[str, Any]:
+    async def test_wikipedia_connectivity() -> Dict[str, Any]:
         """
         Provide diagnostics for Wikipedia API connectivity.
 
@@ -103,8 +345,8 @@ def create_server(
         time in milliseconds. If connectivity fails, status will be 'failed'
         with error details.
         """
-        logger.info("Tool: Testing Wikipedia connectivity")
-        diagnostics = wikipedia_client.test_connectivity()
+        logger.info("Testing connectivity: api_url=%r", wikipedia_client.api_url)
+        diagnostics = await wikipedia_client.call_async("test_connectivity")
 
         # Round response_time_ms for nicer output if present
         if (
@@ -119,248 +361,221 @@ def create_server(
     # Tool: get_article
     # ------------------------------------------------------------------
     @server.tool()
-    def get_article(title: str) -> Dict[str, Any]:
+    async def get_article(title: str) -> Dict[str, Any]:
         """
         Get the full content of a Wikipedia article.
 
         Returns a dictionary containing article details or an error message
         if retrieval fails.
         """
-        logger.info(f"Tool: Getting article: {title}")
-        article = wikipedia_client.get_article(title)
-        # Ensure we always return a dictionary
-        return article or {"title": title, "exists": False, "error": "Unknown error retrieving article"}
+        return await _do_get_article(wikipedia_client, title)
 
     # ------------------------------------------------------------------
     # Tool: get_summary
     # ------------------------------------------------------------------
     @server.tool()
-    def get_summary(title: str) -> Dict[str, Any]:
+    async def get_summary(title: str) -> SummaryResponse:
         """
         Get a summary of a Wikipedia article.
 
         Returns a dictionary with the title and summary string. On error,
         includes an error message instead of a summary.
         """
-        logger.info(f"Tool: Getting summary for: {title}")
-        summary = wikipedia_client.get_summary(title)
-        if summary and not summary.startswith("Error"):
-            return {"title": title, "summary": summary}
-        else:
-            return {"title": title, "summary": None, "error": summary}
+        return await _do_get_summary(wikipedia_client, title)
 
     # ------------------------------------------------------------------
     # Tool: summarize_article_for_query
     # ------------------------------------------------------------------
     @server.tool()
-    def summarize_article_for_query(
+    async def summarize_article_for_query(
         title: str,
         query: str,
-        max_length: Annotated[int, Field(title="Max Length")] = 250,
-    ) -> Dict[str, Any]:
+        max_length: Annotated[int, _MAX_LENGTH_FIELD, _PLAIN_INTEGER_SCHEMA] = 250,
+    ) -> QuerySummaryResponse:
         """
         Get a summary of a Wikipedia article tailored to a specific query.
 
         The summary is a snippet around the query within the article text or
         summary. The max_length parameter controls the length of the snippet.
         """
-        logger.info(f"Tool: Getting query-focused summary for article: {title}, query: {query}")
-        summary = wikipedia_client.summarize_for_query(title, query, max_length=max_length)
-        return {"title": title, "query": query, "summary": summary}
+        return await _do_summarize_for_query(wikipedia_client, title, query, max_length)
 
     # ------------------------------------------------------------------
     # Tool: summarize_article_section
     # ------------------------------------------------------------------
     @server.tool()
-    def summarize_article_section(
+    async def summarize_article_section(
         title: str,
         section_title: str,
-        max_length: Annotated[int, Field(title="Max Length")] = 150,
-    ) -> Dict[str, Any]:
+        max_length: Annotated[int, _MAX_LENGTH_FIELD, _PLAIN_INTEGER_SCHEMA] = 150,
+    ) -> SectionSummaryResponse:
         """
         Get a summary of a specific section of a Wikipedia article.
 
         Returns a dictionary containing the section summary or an error.
         """
-        logger.info(f"Tool: Getting summary for section: {section_title} in article: {title}")
-        summary = wikipedia_client.summarize_section(title, section_title, max_length=max_length)
-        return {"title": title, "section_title": section_title, "summary": summary}
+        return await _do_summarize_section(wikipedia_client, title, section_title, max_length)
 
     # ------------------------------------------------------------------
     # Tool: extract_key_facts
     # ------------------------------------------------------------------
     @server.tool()
-    def extract_key_facts(
+    async def extract_key_facts(
         title: str,
-        topic_within_article: Annotated[str, Field(title="Topic Within Article")] = "",
-        count: int = 5,
-    ) -> Dict[str, Any]:
+        topic_within_article: Annotated[str, _TOPIC_FIELD] = "",
+        count: Annotated[int, _POSITIVE_INT_FIELD, _PLAIN_INTEGER_SCHEMA] = 5,
+    ) -> KeyFactsResponse:
         """
         Extract key facts from a Wikipedia article, optionally focused on a topic.
 
         Returns a dictionary containing a list of facts.
         """
-        logger.info(f"Tool: Extracting key facts for article: {title}, topic: {topic_within_article}")
-        topic = topic_within_article if topic_within_article.strip() else None
-        facts = wikipedia_client.extract_facts(title, topic, count=count)
-        return {"title": title, "topic_within_article": topic_within_article, "facts": facts}
+        return await _do_extract_facts(wikipedia_client, title, topic_within_article, count)
 
     # ------------------------------------------------------------------
     # Tool: get_related_topics
     # ------------------------------------------------------------------
     @server.tool()
-    def get_related_topics(title: str, limit: int = 10) -> Dict[str, Any]:
+    async def get_related_topics(
+        title: str,
+        limit: Annotated[int, _POSITIVE_INT_FIELD, _PLAIN_INTEGER_SCHEMA] = 10,
+    ) -> RelatedTopicsResponse:
         """
         Get topics related to a Wikipedia article based on links and categories.
 
         Returns a list of related topics up to the specified limit.
         """
-        logger.info(f"Tool: Getting related topics for: {title}")
-        related = wikipedia_client.get_related_topics(title, limit=limit)
-        return {"title": title, "related_topics": related}
+        return await _do_get_related_topics(wikipedia_client, title, limit)
 
     # ------------------------------------------------------------------
     # Tool: get_sections
     # ------------------------------------------------------------------
     @server.tool()
-    def get_sections(title: str) -> Dict[str, Any]:
+    async def get_sections(title: str) -> SectionsResponse:
         """
         Get the sections of a Wikipedia article.
 
         Returns a dictionary with the article title and list of sections.
         """
-        logger.info(f"Tool: Getting sections for: {title}")
-        sections = wikipedia_client.get_sections(title)
-        return {"title": title, "sections": sections}
+        return await _do_get_sections(wikipedia_client, title)
 
     # ------------------------------------------------------------------
     # Tool: get_links
     # ------------------------------------------------------------------
     @server.tool()
-    def get_links(title: str) -> Dict[str, Any]:
+    async def get_links(title: str) -> LinksResponse:
         """
         Get the links contained within a Wikipedia article.
 
         Returns a dictionary with the article title and list of links.
         """
-        logger.info(f"Tool: Getting links for: {title}")
-        links = wikipedia_client.get_links(title)
-        return {"title": title, "links": links}
+        return await _do_get_links(wikipedia_client, title)
 
     # ------------------------------------------------------------------
     # Tool: get_coordinates
     # ------------------------------------------------------------------
     @server.tool()
-    def get_coordinates(title: str) -> Dict[str, Any]:
+    async def get_coordinates(title: str) -> Dict[str, Any]:
         """
         Get the coordinates of a Wikipedia article.
 
         Returns a dictionary containing coordinate information.
         """
-        logger.info(f"Tool: Getting coordinates for: {title}")
-        coordinates = wikipedia_client.get_coordinates(title)
-        return coordinates
+        return await _do_get_coordinates(wikipedia_client, title)
+
+    # ------------------------------------------------------------------
+    # Tool: get_article_bundle
+    # ------------------------------------------------------------------
+    @server.tool()
+    async def get_article_bundle(title: str, include: str = "sections,links,coordinates") -> Dict[str, Any]:
+        """
+        Get sections, links and/or coordinates of a Wikipedia article in one request.
+
+        Parameters:
+            title: The title of the Wikipedia article.
+            include: Comma-separated aspects to fetch: sections, links, coordinates.
+
+        Returns a dictionary with the article title, an existence flag and one
+        entry per requested aspect.
+        """
+        return await _do_get_article_bundle(wikipedia_client, title, include)
 
     # ------------------------------------------------------------------
     # HTTP Resources
     # ------------------------------------------------------------------
 
     @server.resource("/search/{query}")
-    def search(query: str) -> Dict[str, Any]:
+    async def search(query: str) -> SearchResponse:
         """
         HTTP resource to search Wikipedia via GET /search/{query}.
 
-        Uses the underlying WikipediaClient.search and always returns a dictionary.
+        Shares its implementation with the search_wikipedia tool.
         """
-        logger.info(f"Searching Wikipedia for: {query}")
-        results = wikipedia_client.search(query, limit=10)
-        return {"query": query, "results": results}
+        return await _do_search(wikipedia_client, query, 10)
 
     @server.resource("/article/{title}")
-    def article(title: str) -> Dict[str, Any]:
+    async def article(title: str) -> Dict[str, Any]:
         """
         HTTP resource to fetch a full article via GET /article/{title}.
 
         Returns article data or an error dictionary.
         """
-        logger.info(f"Getting article: {title}")
-        article_data = wikipedia_client.get_article(title)
-        return article_data or {"title": title, "exists": False, "error": "Unknown error retrieving article"}
+        return await _do_get_article(wikipedia_client, title)
 
     @server.resource("/summary/{title}")
-    def summary(title: str) -> Dict[str, Any]:
+    async def summary(title: str) -> SummaryResponse:
         """
         HTTP resource to fetch the summary of an article via GET /summary/{title}.
         """
-        logger.info(f"Getting summary for: {title}")
-        summary_text = wikipedia_client.get_summary(title)
-        if summary_text and not summary_text.startswith("Error"):
-            return {"title": title, "summary": summary_text}
-        else:
-            return {"title": title, "summary": None, "error": summary_text}
+        return await _do_get_summary(wikipedia_client, title)
 
     @server.resource("/summary/{title}/query/{query}/length/{max_length}")
-    def summary_for_query_resource(title: str, query: str, max_length: int) -> Dict[str, Any]:
+    async def summary_for_query_resource(title: str, query: str, max_length: int) -> QuerySummaryResponse:
         """
         HTTP resource to fetch a query-focused summary via GET /summary/{title}/query/{query}/length/{max_length}.
         """
-        logger.info(
-            f"Resource: Getting query-focused summary for article: {title}, query: {query}, max_length: {max_length}"
-        )
-        summary_text = wikipedia_client.summarize_for_query(title, query, max_length=max_length)
-        return {"title": title, "query": query, "summary": summary_text}
+        return await _do_summarize_for_query(wikipedia_client, title, query, max_length)
 
     @server.resource("/summary/{title}/section/{section_title}/length/{max_length}")
-    def summary_section_resource(title: str, section_title: str, max_length: int) -> Dict[str, Any]:
+    async def summary_section_resource(title: str, section_title: str, max_length: int) -> SectionSummaryResponse:
         """
         HTTP resource to fetch a section summary via GET /summary/{title}/section/{section_title}/length/{max_length}.
         """
-        logger.info(
-            f"Resource: Getting summary for section: {section_title} in article: {title}, max_length: {max_length}"
-        )
-        summary_text = wikipedia_client.summarize_section(title, section_title, max_length=max_length)
-        return {"title": title, "section_title": section_title, "summary": summary_text}
+        return await _do_summarize_section(wikipedia_client, title, section_title, max_length)
 
     @server.resource("/sections/{title}")
-    def sections_resource(title: str) -> Dict[str, Any]:
+    async def sections_resource(title: str) -> SectionsResponse:
         """
         HTTP resource to fetch sections via GET /sections/{title}.
         """
-        logger.info(f"Getting sections for: {title}")
-        sections_list = wikipedia_client.get_sections(title)
-        return {"title": title, "sections": sections_list}
+        return await _do_get_sections(wikipedia_client, title)
 
     @server.resource("/links/{title}")
-    def links_resource(title: str) -> Dict[str, Any]:
+    async def links_resource(title: str) -> LinksResponse:
         """
         HTTP resource to fetch links via GET /links/{title}.
         """
-        logger.info(f"Getting links for: {title}")
-        links_list = wikipedia_client.get_links(title)
-        return {"title": title, "links": links_list}
+        return await _do_get_links(wikipedia_client, title)
 
     @server.resource("/facts/{title}/topic/{topic_within_article}/count/{count}")
-    def key_facts_resource(title: str, topic_within_article: str, count: int) -> Dict[str, Any]:
+    async def key_facts_resource(title: str, topic_within_article: str, count: int) -> KeyFactsResponse:
         """
         HTTP resource to fetch key facts via GET /facts/{title}/topic/{topic_within_article}/count/{count}.
         """
-        logger.info(
-            f"Resource: Extracting key facts for article: {title}, topic: {topic_within_article}, count: {count}"
-        )
-        facts_list = wikipedia_client.extract_facts(title, topic_within_article, count=count)
-        return {
-            "title": title,
-            "topic_within_article": topic_within_article,
-            "facts": facts_list,
-        }
+        return await _do_extract_facts(wikipedia_client, title, topic_within_article, count)
 
     @server.resource("/coordinates/{title}")
-    def coordinates_resource(title: str) -> Dict[str, Any]:
+    async def coordinates_resource(title: str) -> Dict[str, Any]:
         """
         HTTP resource to fetch coordinates via GET /coordinates/{title}.
         """
-        logger.info(f"Getting coordinates for: {title}")
-        coordinates_data = wikipedia_client.get_coordinates(title)
-        return coordinates_data
+        return await _do_get_coordinates(wikipedia_client, title)
+
+    @server.resource("/bundle/{title}")
+    async def bundle_resource(title: str) -> Dict[str, Any]:
+        """
+        HTTP resource to fetch sections, links and coordinates via GET /bundle/{title}.
+        """
+        return await _do_get_article_bundle(wikipedia_client, title, "sections,links,coordinates")
 
     return server
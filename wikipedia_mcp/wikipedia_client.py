@@ -7,21 +7,400 @@ summaries, related topics, key facts, and coordinate lookup. It also
 supports optional caching and authentication via personal access tokens.
 """
 
+import asyncio
+import collections
+import concurrent.futures
+import email.utils
+import importlib.util
+import json
 import logging
+import re
+import threading
+import time
+import httpx
 import wikipediaapi
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 import functools
+import html
+import itertools
+import weakref
+from urllib3.util.retry import Retry
 from wikipedia_mcp import __version__
 
+try:  # Optional accelerator, installed with the "fast" extra
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Section headings in plain-text extracts requested with exsectionformat=wiki
+# (the same pattern wikipediaapi uses to split page text into sections).
+_SECTION_HEADING_RE = re.compile(r"\n\n *(==+) (.*?) (==+) *\n")
+
+# A sentence body and its terminator; periods inside decimal numbers do not
+# end a sentence
+_SENTENCE_RE = re.compile(r"((?:[^.!?]|(?<=\d)\.(?=\d))+)([.!?]?)")
+
+# User-Agent sent with every request, as required by the Wikimedia API policy
+_USER_AGENT = f"WikipediaMCPServer/{__version__} (https://github.com/rudra-ravi/wikipedia-mcp)"
+
+# Markup around matched terms in search result snippets
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+
+# Article aspects served by get_article_bundle, mapped to their query props.
+_BUNDLE_PROPS = {
+    "sections": "extracts",
+    "links": "links",
+    "coordinates": "coordinates",
+}
+
+
+# HTTP/2 and brotli decoding are optional extras (installed with the "fast"
+# extra) for both httpx and requests; only negotiate them when the packages
+# are importable.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_BROTLI_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+_ACCEPT_ENCODING = "gzip, deflate, br" if _BROTLI_AVAILABLE else "gzip, deflate"
+
+# Decoder for API response bodies; the API always answers in UTF-8, so the
+# raw bytes are parsed directly without charset detection
+_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Maximum number of titles per action=query request (API limit for clients
+# without the apihighlimits right)
+_TITLES_PER_QUERY = 50
+
+# Maximum number of intro extracts (prop=extracts with exintro) returned per
+# request; further titles in the same request come back without an extract
+_INTRO_EXTRACTS_PER_QUERY = 20
+
+# Coordinate fields in responses: (response field, API field, default)
+_COORD_FIELDS = (
+    ("latitude", "lat", None),
+    ("longitude", "lon", None),
+    ("primary", "primary", False),
+    ("globe", "globe", "earth"),
+    ("type", "type", ""),
+    ("name", "name", ""),
+    ("region", "region", ""),
+    ("country", "country", ""),
+)
+
+# Query parameters shared by all coordinate lookups; formatversion=2 lists
+# pages in request order and reports flags such as "primary" as booleans
+_COORD_PARAMS: Mapping[str, Any] = MappingProxyType(
+    {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "prop": "coordinates",
+        "coprop": "type|name|region|country|globe",
+        "colimit": "max",
+    }
+)
+
+# Coordinates rarely change, so with caching enabled successful lookups are
+# kept per client for an hour
+_COORD_CACHE_SIZE = 4096
+_COORD_CACHE_TTL = 3600.0
+
+# Retry policy for the pooled requests session: connection and read errors,
+# transient server errors and rate limiting are retried on the same pool with
+# exponential backoff, waiting for Retry-After when the server sends one
+_SESSION_RETRY = Retry(
+    total=5,
+    connect=3,
+    read=3,
+    status=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    # Hand back the last response once retries are used up, so callers
+    # report its HTTP status instead of a generic "max retries" error
+    raise_on_status=False,
+)
+
+# Requests per second issued by the async HTTP client, kept just under the
+# Wikimedia API's limit of 200
+_ASYNC_MAX_RATE = 180
+
+# Rate-limited (429) async requests are retried up to this many times,
+# waiting for Retry-After or else backing off exponentially from 0.5s
+_ASYNC_429_RETRIES = 5
+_ASYNC_BACKOFF_BASE = 0.5
+_ASYNC_BACKOFF_CAP = 30.0
+
+# Upper bound on concurrent upstream calls made through the async API
+_MAX_CONCURRENT_CALLS = 8
+
+
+def _log_response_encoding(response: requests.Response, *args: Any, **kwargs: Any) -> None:
+    """requests response hook logging whether a response arrived compressed."""
+    logger.debug(
+        "Response from %s: Content-Encoding=%s",
+        response.url,
+        response.headers.get("Content-Encoding", "identity"),
+    )
+
+
+def _decode_response(response: Any) -> Any:
+    """
+    Check an API response's status and decode its JSON body.
+
+    Args:
+        response: A requests or httpx response.
+
+    Returns:
+        The decoded JSON response.
+
+    Raises:
+        requests.HTTPError, httpx.HTTPStatusError: If the response has an error status.
+        ValueError: If the body is empty, e.g. after an upstream hiccup.
+    """
+    response.raise_for_status()
+    if not response.content:
+        raise ValueError(f"Empty response from the Wikipedia API (HTTP {response.status_code})")
+    return _loads(response.content)
+
+
+def _check_api_error(data: Dict[str, Any]) -> None:
+    """
+    Raise if a decoded API response reports an error.
+
+    Raises:
+        ValueError: If the API reported an error.
+    """
+    if "error" in data:
+        error_info = data["error"]
+        raise ValueError(
+            f"Wikipedia API error: {error_info.get('code', 'unknown')} - {error_info.get('info', 'No details')}"
+        )
 
-class WikipediaClient:
-    """Client for interacting with the Wikipedia API."""
 
-    # Language variant mappings - maps variant codes to their base language
-    LANGUAGE_VARIANTS = {
+def _merge_query_batch(
+    pages: Dict[str, Dict[str, Any]],
+    data: Dict[str, Any],
+    aliases: Optional[Dict[str, str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Merge one action=query response batch into ``pages``.
+
+    List-valued page properties (links, coordinates, ...) are concatenated
+    across batches; other properties keep their first value.
+
+    Args:
+        pages: Pages merged so far, keyed by page ID. Updated in place.
+        data: The decoded API response.
+        aliases: If given, updated in place with the title normalizations and
+            redirects reported by the API (requested title -> resolved title).
+
+    Returns:
+        The continuation parameters, or None if this was the last batch.
+
+    Raises:
+        ValueError: If the API reported an error.
+    """
+    _check_api_error(data)
+
+    query = data.get("query", {})
+    if aliases is not None:
+        for mapping in query.get("normalized", []) + query.get("redirects", []):
+            aliases[mapping["from"]] = mapping["to"]
+
+    batch_pages = query.get("pages", {})
+    if isinstance(batch_pages, list):
+        # formatversion=2 lists pages; missing pages have no page ID
+        batch_pages = {str(page.get("pageid", page.get("title"))): page for page in batch_pages}
+
+    for page_id, page_data in batch_pages.items():
+        merged = pages.setdefault(page_id, {})
+        for key, value in page_data.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, value)
+
+    return data.get("continue")
+
+
+def _iter_sections(extract: str) -> Iterator[Tuple[int, Optional[str], str]]:
+    """
+    Lazily split a wiki-formatted plain-text extract into sections.
+
+    Args:
+        extract: Article text as returned by prop=extracts with exsectionformat=wiki.
+
+    Yields:
+        (level, title, text) tuples in document order, starting with the lead
+        section (level 0, title None). Levels count nesting depth from 0, as in
+        WikipediaClient._extract_sections.
+    """
+    # Heading depths of the currently open sections
+    open_depths: List[int] = []
+    level, title, start = 0, None, 0
+
+    for match in _SECTION_HEADING_RE.finditer(extract):
+        yield level, title, extract[start : match.start()].strip()
+
+        depth = len(match.group(1))
+        while open_depths and open_depths[-1] >= depth:
+            open_depths.pop()
+        level, title, start = len(open_depths), match.group(2).strip(), match.end()
+        open_depths.append(depth)
+
+    yield level, title, extract[start:].strip()
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """
+    Lazily yield the stripped, non-empty sentences of ``text``.
+
+    Sentences end at ".", "!" or "?", except for a "." between two digits
+    (decimal numbers). Each sentence keeps its terminator; a final sentence
+    without one gets a ".". Scanning stops as soon as the caller has taken
+    enough sentences.
+    """
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group(1).strip()
+        if sentence:
+            yield sentence + (match.group(2) or ".")
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited request.
+
+    Args:
+        retry_after: The response's Retry-After header (seconds or an HTTP date), if any.
+        attempt: Zero-based number of the retry.
+
+    Returns:
+        The Retry-After delay when it can be parsed, otherwise exponential
+        backoff; capped at _ASYNC_BACKOFF_CAP either way.
+    """
+    delay = _ASYNC_BACKOFF_BASE * 2**attempt
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0.0), _ASYNC_BACKOFF_CAP)
+
+
+def _title_key(title: str) -> str:
+    """Normalize a title the way MediaWiki does for cache lookups ("new_york " -> "New york")."""
+    title = " ".join(title.replace("_", " ").split())
+    return title[:1].upper() + title[1:]
+
+
+def _page_exists(page_data: Dict[str, Any]) -> bool:
+    """
+    Tell whether an action=query page entry describes an existing page.
+
+    Missing and invalid titles come back flagged and without a page ID, so no
+    separate existence request is needed.
+    """
+    return "pageid" in page_data and "missing" not in page_data and "invalid" not in page_data
+
+
+def _render_extract(extract: str) -> Tuple[str, str]:
+    """
+    Render a wiki-formatted plain-text extract the way wikipediaapi does.
+
+    Args:
+        extract: Article text as returned by prop=extracts with exsectionformat=wiki.
+
+    Returns:
+        A (summary, text) tuple: the lead section, and the full text with each
+        section heading on a line of its own above the section body.
+    """
+    summary = ""
+    parts: List[str] = []
+    for _, title, text in _iter_sections(extract):
+        if title is None:
+            summary = text
+            parts.append(text + "\n\n" if text else "")
+        else:
+            parts.append(f"{title}\n{text}\n\n" if text else f"{title}\n")
+    return summary, "".join(parts).strip()
+
+
+def _walk_sections(sections: List[Any]) -> Iterator[Any]:
+    """
+    Yield wikipediaapi sections and all their subsections in document order.
+
+    The tree is walked pre-order with an explicit stack instead of recursion.
+    """
+    stack = list(reversed(sections))
+    while stack:
+        section = stack.pop()
+        yield section
+        stack.extend(reversed(section.sections))
+
+
+def _find_section(sections: List[Any], target: str) -> Optional[Any]:
+    """
+    Find the first section, in document order, whose title matches ``target``.
+
+    Args:
+        sections: wikipediaapi sections to search, including their subsections.
+        target: The section title to look for, already casefolded.
+
+    Returns:
+        The matching section, or None if there is none.
+    """
+    return next((section for section in _walk_sections(sections) if section.title.casefold() == target), None)
+
+
+def _parse_sections(extract: str) -> List[Dict[str, Any]]:
+    """
+    Build a nested section list from a wiki-formatted plain-text extract.
+
+    Args:
+        extract: Article text as returned by prop=extracts with exsectionformat=wiki.
+
+    Returns:
+        A list of sections in the same shape as WikipediaClient._extract_sections.
+    """
+    root: List[Dict[str, Any]] = []
+    # children lists of the currently open sections, indexed by level
+    stack: List[List[Dict[str, Any]]] = [root]
+
+    for level, title, text in _iter_sections(extract):
+        if title is None:  # lead section
+            continue
+        del stack[level + 1 :]
+        section: Dict[str, Any] = {"title": title, "level": level, "text": text, "sections": []}
+        stack[level].append(section)
+        stack.append(section["sections"])
+    return root
+
+
+# Language variant mappings - maps variant codes to their base language
+_LANGUAGE_VARIANTS: Mapping[str, str] = MappingProxyType(
+    {
         "zh-hans": "zh",  # Simplified Chinese
         "zh-hant": "zh",  # Traditional Chinese
         "zh-tw": "zh",  # Traditional Chinese (Taiwan)
@@ -39,226 +418,318 @@ class WikipediaClient:
         "ku-latn": "ku",  # Kurdish Latin
         "ku-arab": "ku",  # Kurdish Arabic
     }
+)
 
-    # Country/locale to language code mappings (partial list)
-    COUNTRY_TO_LANGUAGE = {
+# Country/locale codes (ISO 3166-1 alpha-2 plus common aliases) -> language
+_CODE_TO_LANG: Mapping[str, str] = MappingProxyType(
+    {
         # English-speaking countries
         "US": "en",
         "USA": "en",
-        "United States": "en",
         "UK": "en",
         "GB": "en",
-        "United Kingdom": "en",
         "CA": "en",
-        "Canada": "en",
         "AU": "en",
-        "Australia": "en",
         "NZ": "en",
-        "New Zealand": "en",
         "IE": "en",
-        "Ireland": "en",
         "ZA": "en",
-        "South Africa": "en",
         # Chinese-speaking countries/regions
         "CN": "zh-hans",
-        "China": "zh-hans",
         "TW": "zh-tw",
-        "Taiwan": "zh-tw",
         "HK": "zh-hk",
-        "Hong Kong": "zh-hk",
         "MO": "zh-mo",
-        "Macau": "zh-mo",
         "SG": "zh-sg",
-        "Singapore": "zh-sg",
         "MY": "zh-my",
-        "Malaysia": "zh-my",
         # Major European countries
         "DE": "de",
-        "Germany": "de",
         "FR": "fr",
-        "France": "fr",
         "ES": "es",
-        "Spain": "es",
         "IT": "it",
-        "Italy": "it",
         "PT": "pt",
-        "Portugal": "pt",
         "NL": "nl",
-        "Netherlands": "nl",
         "PL": "pl",
-        "Poland": "pl",
         "RU": "ru",
-        "Russia": "ru",
         "UA": "uk",
-        "Ukraine": "uk",
         "TR": "tr",
-        "Turkey": "tr",
         "GR": "el",
-        "Greece": "el",
         "SE": "sv",
-        "Sweden": "sv",
         "NO": "no",
-        "Norway": "no",
         "DK": "da",
-        "Denmark": "da",
         "FI": "fi",
-        "Finland": "fi",
         "IS": "is",
-        "Iceland": "is",
         "CZ": "cs",
-        "Czech Republic": "cs",
         "SK": "sk",
-        "Slovakia": "sk",
         "HU": "hu",
-        "Hungary": "hu",
         "RO": "ro",
-        "Romania": "ro",
         "BG": "bg",
-        "Bulgaria": "bg",
         "HR": "hr",
-        "Croatia": "hr",
         "SI": "sl",
-        "Slovenia": "sl",
         "RS": "sr",
-        "Serbia": "sr",
         "BA": "bs",
-        "Bosnia and Herzegovina": "bs",
         "MK": "mk",
-        "Macedonia": "mk",
         "AL": "sq",
-        "Albania": "sq",
         "MT": "mt",
-        "Malta": "mt",
         # Asian countries
         "JP": "ja",
-        "Japan": "ja",
         "KR": "ko",
-        "South Korea": "ko",
         "IN": "hi",
-        "India": "hi",
         "TH": "th",
-        "Thailand": "th",
         "VN": "vi",
-        "Vietnam": "vi",
         "ID": "id",
-        "Indonesia": "id",
         "PH": "tl",
-        "Philippines": "tl",
         "BD": "bn",
-        "Bangladesh": "bn",
         "PK": "ur",
-        "Pakistan": "ur",
         "LK": "si",
-        "Sri Lanka": "si",
         "MM": "my",
-        "Myanmar": "my",
         "KH": "km",
-        "Cambodia": "km",
         "LA": "lo",
-        "Laos": "lo",
         "MN": "mn",
-        "Mongolia": "mn",
         "KZ": "kk",
-        "Kazakhstan": "kk",
         "UZ": "uz",
-        "Uzbekistan": "uz",
         "AF": "fa",
-        "Afghanistan": "fa",
         # Middle Eastern countries
         "IR": "fa",
-        "Iran": "fa",
         "SA": "ar",
-        "Saudi Arabia": "ar",
         "AE": "ar",
         "UAE": "ar",
         "EG": "ar",
-        "Egypt": "ar",
         "IQ": "ar",
-        "Iraq": "ar",
         "SY": "ar",
-        "Syria": "ar",
         "JO": "ar",
-        "Jordan": "ar",
         "LB": "ar",
-        "Lebanon": "ar",
         "IL": "he",
-        "Israel": "he",
         # African countries
         "MA": "ar",
-        "Morocco": "ar",
         "DZ": "ar",
-        "Algeria": "ar",
         "TN": "ar",
-        "Tunisia": "ar",
         "LY": "ar",
-        "Libya": "ar",
         "SD": "ar",
-        "Sudan": "ar",
         "ET": "am",
-        "Ethiopia": "am",
         "KE": "sw",
-        "Kenya": "sw",
         "TZ": "sw",
-        "Tanzania": "sw",
         "NG": "ha",
-        "Nigeria": "ha",
         "GH": "en",
-        "Ghana": "en",
         # Latin American countries
         "MX": "es",
-        "Mexico": "es",
         "AR": "es",
-        "Argentina": "es",
         "CO": "es",
-        "Colombia": "es",
         "VE": "es",
-        "Venezuela": "es",
         "PE": "es",
-        "Peru": "es",
         "CL": "es",
-        "Chile": "es",
         "EC": "es",
-        "Ecuador": "es",
         "BO": "es",
-        "Bolivia": "es",
         "PY": "es",
-        "Paraguay": "es",
         "UY": "es",
-        "Uruguay": "es",
         "CR": "es",
-        "Costa Rica": "es",
         "PA": "es",
-        "Panama": "es",
         "GT": "es",
-        "Guatemala": "es",
         "HN": "es",
-        "Honduras": "es",
         "SV": "es",
-        "El Salvador": "es",
         "NI": "es",
-        "Nicaragua": "es",
         "CU": "es",
-        "Cuba": "es",
         "DO": "es",
-        "Dominican Republic": "es",
         "BR": "pt",
-        "Brazil": "pt",
         # Additional countries (partial)
         "BY": "be",
-        "Belarus": "be",
         "EE": "et",
-        "Estonia": "et",
         "LV": "lv",
-        "Latvia": "lv",
         "LT": "lt",
-        "Lithuania": "lt",
         "GE": "ka",
-        "Georgia": "ka",
         "AM": "hy",
-        "Armenia": "hy",
         "AZ": "az",
-        "Azerbaijan": "az",
     }
+)
+
+# Country/region names -> their code in _CODE_TO_LANG
+_NAME_TO_CODE: Mapping[str, str] = MappingProxyType(
+    {
+        # English-speaking countries
+        "United States": "USA",
+        "United Kingdom": "GB",
+        "Canada": "CA",
+        "Australia": "AU",
+        "New Zealand": "NZ",
+        "Ireland": "IE",
+        "South Africa": "ZA",
+        # Chinese-speaking countries/regions
+        "China": "CN",
+        "Taiwan": "TW",
+        "Hong Kong": "HK",
+        "Macau": "MO",
+        "Singapore": "SG",
+        "Malaysia": "MY",
+        # Major European countries
+        "Germany": "DE",
+        "France": "FR",
+        "Spain": "ES",
+        "Italy": "IT",
+        "Portugal": "PT",
+        "Netherlands": "NL",
+        "Poland": "PL",
+        "Russia": "RU",
+        "Ukraine": "UA",
+        "Turkey": "TR",
+        "Greece": "GR",
+        "Sweden": "SE",
+        "Norway": "NO",
+        "Denmark": "DK",
+        "Finland": "FI",
+        "Iceland": "IS",
+        "Czech Republic": "CZ",
+        "Slovakia": "SK",
+        "Hungary": "HU",
+        "Romania": "RO",
+        "Bulgaria": "BG",
+        "Croatia": "HR",
+        "Slovenia": "SI",
+        "Serbia": "RS",
+        "Bosnia and Herzegovina": "BA",
+        "Macedonia": "MK",
+        "Albania": "AL",
+        "Malta": "MT",
+        # Asian countries
+        "Japan": "JP",
+        "South Korea": "KR",
+        "India": "IN",
+        "Thailand": "TH",
+        "Vietnam": "VN",
+        "Indonesia": "ID",
+        "Philippines": "PH",
+        "Bangladesh": "BD",
+        "Pakistan": "PK",
+        "Sri Lanka": "LK",
+        "Myanmar": "MM",
+        "Cambodia": "KH",
+        "Laos": "LA",
+        "Mongolia": "MN",
+        "Kazakhstan": "KZ",
+        "Uzbekistan": "UZ",
+        "Afghanistan": "AF",
+        # Middle Eastern countries
+        "Iran": "IR",
+        "Saudi Arabia": "SA",
+        "Egypt": "EG",
+        "Iraq": "IQ",
+        "Syria": "SY",
+        "Jordan": "JO",
+        "Lebanon": "LB",
+        "Israel": "IL",
+        # African countries
+        "Morocco": "MA",
+        "Algeria": "DZ",
+        "Tunisia": "TN",
+        "Libya": "LY",
+        "Sudan": "SD",
+        "Ethiopia": "ET",
+        "Kenya": "KE",
+        "Tanzania": "TZ",
+        "Nigeria": "NG",
+        "Ghana": "GH",
+        # Latin American countries
+        "Mexico": "MX",
+        "Argentina": "AR",
+        "Colombia": "CO",
+        "Venezuela": "VE",
+        "Peru": "PE",
+        "Chile": "CL",
+        "Ecuador": "EC",
+        "Bolivia": "BO",
+        "Paraguay": "PY",
+        "Uruguay": "UY",
+        "Costa Rica": "CR",
+        "Panama": "PA",
+        "Guatemala": "GT",
+        "Honduras": "HN",
+        "El Salvador": "SV",
+        "Nicaragua": "NI",
+        "Cuba": "CU",
+        "Dominican Republic": "DO",
+        "Brazil": "BR",
+        # Additional countries (partial)
+        "Belarus": "BY",
+        "Estonia": "EE",
+        "Latvia": "LV",
+        "Lithuania": "LT",
+        "Georgia": "GE",
+        "Armenia": "AM",
+        "Azerbaijan": "AZ",
+    }
+)
+
+# Combined country/locale -> language view, each code followed by its names
+_COUNTRY_TO_LANGUAGE: Mapping[str, str] = MappingProxyType(
+    {
+        key: language
+        for code, language in _CODE_TO_LANG.items()
+        for key in (code, *(name for name, name_code in _NAME_TO_CODE.items() if name_code == code))
+    }
+)
+
+# Case-insensitive lookup indexes for two-step resolution: name -> code -> language
+_NORMALIZED_NAME_TO_CODE: Mapping[str, str] = MappingProxyType(
+    {name.casefold(): code.casefold() for name, code in _NAME_TO_CODE.items()}
+)
+_NORMALIZED_CODE_TO_LANG: Mapping[str, str] = MappingProxyType(
+    {code.casefold(): language for code, language in _CODE_TO_LANG.items()}
+)
+
+# Suggested codes for unsupported-country errors
+_COUNTRY_SUGGESTIONS = tuple(c for c in _CODE_TO_LANG if len(c) <= 3)[:10]
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_country_to_language(country: str) -> str:
+    """
+    Resolve country/locale code to language code.
+
+    Args:
+        country: The country/locale code (e.g., 'US', 'CN', 'Taiwan').
+
+    Returns:
+        The corresponding language code.
+
+    Raises:
+        ValueError: If the country code is not supported.
+    """
+    try:
+        key = country.strip().casefold()
+        return _NORMALIZED_CODE_TO_LANG[_NORMALIZED_NAME_TO_CODE.get(key, key)]
+    except KeyError:
+        # Provide helpful error message with suggestions
+        raise ValueError(
+            f"Unsupported country/locale: '{country}'. "
+            f"Supported country codes include: {', '.join(_COUNTRY_SUGGESTIONS)}. "
+            f"Use --language parameter for direct language codes instead."
+        ) from None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_language_variant(language: str) -> Tuple[str, Optional[str]]:
+    """
+    Parse language code and extract base language and variant.
+
+    Args:
+        language: The language code, possibly with variant (e.g., 'zh-hans', 'zh-tw').
+
+    Returns:
+        A tuple of (base_language, variant) where variant is None if not a variant.
+    """
+    base_language = _LANGUAGE_VARIANTS.get(language)
+    if base_language:
+        return base_language, language
+    return language, None
+
+
+class WikipediaClient:
+    """Client for interacting with the Wikipedia API."""
+
+    # Read-only views of the module-level mappings, kept for compatibility
+    LANGUAGE_VARIANTS = _LANGUAGE_VARIANTS
+    COUNTRY_TO_LANGUAGE = _COUNTRY_TO_LANGUAGE
+
+    # Memoized module-level resolvers, kept as methods for compatibility
+    _resolve_country_to_language = staticmethod(_resolve_country_to_language)
+    _parse_language_variant = staticmethod(_parse_language_variant)
 
     def __init__(
         self,
@@ -266,6 +737,8 @@ class WikipediaClient:
         country: Optional[str] = None,
         enable_cache: bool = False,
         access_token: Optional[str] = None,
+        timeout: float = 30.0,
+        use_http2: bool = True,
     ):
         """
         Initialize the Wikipedia client.
@@ -278,10 +751,13 @@ class WikipediaClient:
             enable_cache: Whether to enable caching for API calls (default: False).
             access_token: Personal Access Token for Wikipedia API authentication (optional).
                           Used to increase rate limits and avoid 403 errors.
+            timeout: Timeout in seconds for Wikipedia API requests (default: 30).
+            use_http2: Whether the async HTTP client multiplexes requests over
+                       HTTP/2 when h2 is installed (default: True).
         """
         # Resolve country to language if country is provided
         if country:
-            resolved_language = self._resolve_country_to_language(country)
+            resolved_language = _resolve_country_to_language(country)
             self.original_input = country
             self.input_type = "country"
             self.resolved_language = resolved_language
@@ -296,10 +772,23 @@ class WikipediaClient:
 
         self.enable_cache = enable_cache
         self.access_token = access_token
-        self.user_agent = f"WikipediaMCPServer/{__version__} (https://github.com/rudra-ravi/wikipedia-mcp)"
+        self.timeout = timeout
+        self.use_http2 = use_http2
+        self.user_agent = _USER_AGENT
+
+        # Request headers, built once and shared read-only by both HTTP clients;
+        # API responses are JSON and compress well
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        }
+        if access_token:
+            headers["Authorization"] = f"Bearer {access_token}"
+        self._headers: Mapping[str, str] = MappingProxyType(headers)
 
         # Parse language and variant
-        self.base_language, self.language_variant = self._parse_language_variant(self.resolved_language)
+        self.base_language, self.language_variant = _parse_language_variant(self.resolved_language)
 
         # Use base language for API and library initialization
         self.wiki = wikipediaapi.Wikipedia(
@@ -309,89 +798,187 @@ class WikipediaClient:
         )
         self.api_url = f"https://{self.base_language}.wikipedia.org/w/api.php"
 
+        # Pooled session for direct API calls: connections (and their TLS
+        # sessions) are kept alive and reused across requests
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.hooks["response"].append(_log_response_encoding)
+        # (one host per client, so a single connection pool)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=_SESSION_RETRY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Shared async HTTP clients, one per event loop, created lazily by
+        # _get_async_http
+        self._async_http: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_users = 0
+        self._rate_limiter = _AsyncRateLimiter(_ASYNC_MAX_RATE)
+
+        # Per-event-loop singleflight state, (re)created by _singleflight
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Task] = {}
+        self._call_limit: Optional[asyncio.Semaphore] = None
+        self._call_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Per-title coordinates, filled by get_coordinates_batch
+        self._coord_cache: Optional[_TTLCache] = (
+            _TTLCache(_COORD_CACHE_SIZE, _COORD_CACHE_TTL) if self.enable_cache else None
+        )
+
         if self.enable_cache:
-            # Wrap methods with lru_cache to enable caching when requested
-            self.search = functools.lru_cache(maxsize=128)(self.search)
-            self.get_article = functools.lru_cache(maxsize=128)(self.get_article)
-            self.get_summary = functools.lru_cache(maxsize=128)(self.get_summary)
-            self.get_sections = functools.lru_cache(maxsize=128)(self.get_sections)
-            self.get_links = functools.lru_cache(maxsize=128)(self.get_links)
-            self.get_related_topics = functools.lru_cache(maxsize=128)(self.get_related_topics)
-            self.summarize_for_query = functools.lru_cache(maxsize=128)(self.summarize_for_query)
-            self.summarize_section = functools.lru_cache(maxsize=128)(self.summarize_section)
-            self.extract_facts = functools.lru_cache(maxsize=128)(self.extract_facts)
-            self.get_coordinates = functools.lru_cache(maxsize=128)(self.get_coordinates)
+            # Route cacheable methods through the module-level caches shared
+            # by all clients with the same language, variant and token
+            cache_key = _ClientKey(self)
+            for name, cache in _SHARED_CACHES.items():
+                setattr(self, name, _BoundCache(cache, cache_key))
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-    def _resolve_country_to_language(self, country: str) -> str:
+    def close(self) -> None:
         """
-        Resolve country/locale code to language code.
+        Release the HTTP connections held by this client and by the underlying wikipediaapi client.
 
-        Args:
-            country: The country/locale code (e.g., 'US', 'CN', 'Taiwan').
+        wikipediaapi keeps its HTTP session on a private attribute whose name
+        depends on the library version (``_session`` for requests-based
+        releases, ``_client`` for httpx-based ones).
+        """
+        self._session.close()
+        for attr in ("_session", "_client"):
+            http_client = getattr(self.wiki, attr, None)
+            if http_client is not None and hasattr(http_client, "close"):
+                http_client.close()
 
-        Returns:
-            The corresponding language code.
+    def clear_cache(self) -> None:
+        """
+        Drop all cached results.
 
-        Raises:
-            ValueError: If the country code is not supported.
+        The method caches are shared by clients with the same configuration,
+        so their entries are dropped for those clients too.
         """
-        # Normalize country code (upper case, handle common variations)
-        country_upper = country.upper().strip()
-        country_title = country.title().strip()
+        if self._coord_cache is not None:
+            self._coord_cache.clear()
+        if self.enable_cache:
+            for cache in _SHARED_CACHES.values():
+                cache.cache_clear()
 
-        # Try exact matches first
-        if country_upper in self.COUNTRY_TO_LANGUAGE:
-            return self.COUNTRY_TO_LANGUAGE[country_upper]
+    def __enter__(self) -> "WikipediaClient":
+        return self
 
-        # Try title case
-        if country_title in self.COUNTRY_TO_LANGUAGE:
-            return self.COUNTRY_TO_LANGUAGE[country_title]
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
-        # Try original case
-        if country in self.COUNTRY_TO_LANGUAGE:
-            return self.COUNTRY_TO_LANGUAGE[country]
+    async def aclose(self) -> None:
+        """Close the running event loop's shared async HTTP client, if one has been created."""
+        http_client = self._async_http.pop(asyncio.get_running_loop(), None)
+        if http_client is not None:
+            await http_client.aclose()
 
-        # Provide helpful error message with suggestions
-        available_countries = list(self.COUNTRY_TO_LANGUAGE.keys())
-        # Get first 10 country codes for suggestions
-        country_codes = [c for c in available_countries if len(c) <= 3][:10]
+    async def __aenter__(self) -> "WikipediaClient":
+        self._async_users += 1
+        return self
 
-        raise ValueError(
-            f"Unsupported country/locale: '{country}'. "
-            f"Supported country codes include: {', '.join(country_codes)}. "
-            f"Use --language parameter for direct language codes instead."
-        )
+    async def __aexit__(self, *exc_info: Any) -> None:
+        # Several servers (or sessions) may share one client; the async HTTP
+        # client is closed when the last of them exits.
+        self._async_users -= 1
+        if self._async_users <= 0:
+            self._async_users = 0
+            await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _get_request_headers(self) -> Mapping[str, str]:
+        """
+        Get request headers for API calls, including authentication if available.
 
-    def _parse_language_variant(self, language: str) -> tuple[str, Optional[str]]:
+        Returns:
+            Read-only mapping of the headers to use for requests.
         """
-        Parse language code and extract base language and variant.
+        return self._headers
 
-        Args:
-            language: The language code, possibly with variant (e.g., 'zh-hans', 'zh-tw').
+    def _get_async_http(self) -> httpx.AsyncClient:
+        """
+        Return the shared async HTTP client, creating it on first use.
+
+        Concurrent requests reuse its keep-alive connections, multiplexed over
+        HTTP/2 when h2 is installed and use_http2 is set. httpx clients are
+        bound to the event loop they were first used on, so each loop gets
+        its own, closed by aclose() on that loop.
 
         Returns:
-            A tuple of (base_language, variant) where variant is None if not a variant.
+            The httpx.AsyncClient for the current event loop.
         """
-        if language in self.LANGUAGE_VARIANTS:
-            base_language = self.LANGUAGE_VARIANTS[language]
-            return base_language, language
-        else:
-            return language, None
+        loop = asyncio.get_running_loop()
+        http_client = self._async_http.get(loop)
+        if http_client is None:
+            http_client = self._async_http[loop] = httpx.AsyncClient(
+                http2=self.use_http2 and _HTTP2_AVAILABLE,
+                headers=dict(self._headers),
+                limits=httpx.Limits(max_keepalive_connections=_MAX_CONCURRENT_CALLS, max_connections=32),
+                timeout=self.timeout,
+            )
+        return http_client
 
-    def _get_request_headers(self) -> Dict[str, str]:
+    async def _singleflight(self, key: Tuple[Any, ...], call: Callable[[], Awaitable[T]]) -> T:
         """
-        Get request headers for API calls, including authentication if available.
+        Await ``call()``, sharing the result with concurrent callers of the same key.
+
+        While a call for ``key`` is in flight, further callers await its result
+        instead of issuing a duplicate upstream request. The call runs as its
+        own task that every caller awaits shielded, so a cancelled caller
+        (including the first) does not cancel it for the others. At most
+        _MAX_CONCURRENT_CALLS distinct calls run at once.
+
+        Args:
+            key: Identifies the request, e.g. ("get_article", title).
+            call: Starts the request when no identical one is in flight.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        loop = asyncio.get_running_loop()
+        if self._call_loop is not loop or self._call_limit is None:
+            # Tasks and semaphores belong to one event loop
+            self._inflight = {}
+            self._call_limit = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+            self._call_loop = loop
+        call_limit = self._call_limit
+
+        task = self._inflight.get(key)
+        if task is None:
+
+            async def limited_call() -> T:
+                async with call_limit:
+                    return await call()
+
+            task = loop.create_task(limited_call())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._call_done, key))
+        return await asyncio.shield(task)
+
+    def _call_done(self, key: Tuple[Any, ...], task: "asyncio.Task[Any]") -> None:
+        """Forget a finished _singleflight call."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved in case every caller was cancelled
+
+    async def call_async(self, method: str, *args: Any) -> Any:
+        """
+        Run a synchronous client method in a worker thread without blocking the event loop.
+
+        Concurrent calls with the same method and arguments share one upstream
+        request. Cached methods are used when caching is enabled.
+
+        Args:
+            method: Name of the client method, e.g. "get_article".
+            *args: Positional arguments for the method.
 
         Returns:
-            Dictionary of headers to use for requests.
+            Whatever the method returns.
         """
-        headers = {"User-Agent": self.user_agent}
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-        return headers
+        bound = getattr(self, method)
+        return await self._singleflight((method, *args), lambda: asyncio.to_thread(bound, *args))
 
     def _add_variant_to_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -408,6 +995,87 @@ class WikipediaClient:
             params["variant"] = self.language_variant
         return params
 
+    def _query_pages(
+        self,
+        params: Dict[str, Any],
+        aliases: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run an action=query request, following API continuation.
+
+        List-valued page properties (links, coordinates, ...) returned across
+        continuation batches are merged, so callers see one dict per page.
+
+        Args:
+            params: The API request parameters.
+            aliases: If given, filled with the API's title normalizations and
+                redirects (requested title -> resolved title).
+
+        Returns:
+            The pages from the response, keyed by page ID.
+        """
+        request_params = self._add_variant_to_params(params)
+        pages: Dict[str, Dict[str, Any]] = {}
+
+        while True:
+            response = self._session.get(
+                self.api_url,
+                params=request_params,
+                timeout=self.timeout,
+            )
+            continuation = _merge_query_batch(pages, _decode_response(response), aliases)
+            if continuation is None:
+                return pages
+            request_params = {**request_params, **continuation}
+
+    async def _get_async(self, params: Dict[str, Any]) -> Any:
+        """
+        Send an API request on the shared async HTTP client and decode the response.
+
+        Requests are paced to _ASYNC_MAX_RATE per second. Rate-limited (429)
+        responses are retried up to _ASYNC_429_RETRIES times, honouring
+        Retry-After.
+
+        Args:
+            params: The API request parameters.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            httpx.HTTPStatusError: If the final response has an error status.
+        """
+        http = self._get_async_http()
+        for attempt in itertools.count():
+            await self._rate_limiter.acquire()
+            response = await http.get(self.api_url, params=params)
+            if response.status_code != 429 or attempt >= _ASYNC_429_RETRIES:
+                return _decode_response(response)
+            delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+            logger.warning("Rate limited by the Wikipedia API, retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+
+    async def _query_pages_async(self, params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run an action=query request on the shared async HTTP client.
+
+        Behaves like _query_pages, following continuation and merging pages.
+
+        Args:
+            params: The API request parameters.
+
+        Returns:
+            The pages from the response, keyed by page ID.
+        """
+        request_params = self._add_variant_to_params(params)
+        pages: Dict[str, Dict[str, Any]] = {}
+
+        while True:
+            continuation = _merge_query_batch(pages, await self._get_async(request_params))
+            if continuation is None:
+                return pages
+            request_params = {**request_params, **continuation}
+
     # ------------------------------------------------------------------
     # Diagnostics
     # ------------------------------------------------------------------
@@ -429,14 +1097,14 @@ class WikipediaClient:
 
         try:
             logger.info(f"Testing connectivity to {test_url}")
-            response = requests.get(
+            started_ns = time.perf_counter_ns()
+            response = self._session.get(
                 test_url,
-                headers=self._get_request_headers(),
                 params=test_params,
                 timeout=10,
             )
-            response.raise_for_status()
-            data = response.json()
+            elapsed_ms = (time.perf_counter_ns() - started_ns) / 1e6
+            data = _decode_response(response)
 
             site_info = data.get("query", {}).get("general", {})
 
@@ -446,8 +1114,8 @@ class WikipediaClient:
                 "language": self.base_language,
                 "site_name": site_info.get("sitename", "Unknown"),
                 "server": site_info.get("server", "Unknown"),
-                # Round response time to milliseconds with high precision
-                "response_time_ms": response.elapsed.total_seconds() * 1000,
+                # End-to-end request time, including connection setup and body download
+                "response_time_ms": elapsed_ms,
             }
 
         except Exception as exc:  # pragma: no cover - safeguarded
@@ -506,14 +1174,12 @@ class WikipediaClient:
 
         try:
             logger.debug("Making search request to %s with params %s", self.api_url, params)
-            response = requests.get(
+            response = self._session.get(
                 self.api_url,
-                headers=self._get_request_headers(),
                 params=params,
-                timeout=30,
+                timeout=self.timeout,
             )
-            response.raise_for_status()
-            data = response.json()
+            data = _decode_response(response)
 
             if "error" in data:
                 error_info = data["error"]
@@ -555,20 +1221,10 @@ class WikipediaClient:
 
             return results
 
-        except requests.exceptions.Timeout as exc:
-            logger.error("Search request timed out for query '%s': %s", trimmed_query, exc)
-            return []
-        except requests.exceptions.ConnectionError as exc:
-            logger.error("Connection error when searching for '%s': %s", trimmed_query, exc)
-            return []
-        except requests.exceptions.HTTPError as exc:
-            logger.error("HTTP error when searching for '%s': %s", trimmed_query, exc)
-            return []
-        except requests.exceptions.RequestException as exc:
-            logger.error("Request error when searching for '%s': %s", trimmed_query, exc)
-            return []
-        except ValueError as exc:
-            logger.error("JSON decode error when searching for '%s': %s", trimmed_query, exc)
+        except (requests.exceptions.RequestException, ValueError) as exc:
+            # Network, HTTP status and JSON decode failures; the exception type
+            # identifies which
+            logger.error("%s when searching for '%s': %s", type(exc).__name__, trimmed_query, exc)
             return []
         except Exception as exc:  # pragma: no cover - unexpected safeguard
             logger.error("Unexpected error searching Wikipedia for '%s': %s", trimmed_query, exc)
@@ -581,6 +1237,10 @@ class WikipediaClient:
         """
         Get the full content of a Wikipedia article.
 
+        The text, sections, categories, links and URL all come from one
+        action=query request (plus continuation batches for long link or
+        category lists).
+
         Args:
             title: The title of the Wikipedia article.
 
@@ -588,29 +1248,37 @@ class WikipediaClient:
             A dictionary containing the article information.
         """
         try:
-            page = self.wiki.page(title)
-
-            if not page.exists():
+            pages = self._query_pages(
+                {
+                    "action": "query",
+                    "format": "json",
+                    "prop": "extracts|links|categories|info",
+                    "titles": title,
+                    "explaintext": 1,
+                    "exsectionformat": "wiki",
+                    "pllimit": "max",
+                    "cllimit": "max",
+                    "inprop": "url",
+                    "redirects": 1,
+                }
+            )
+            page_data = next(iter(pages.values()), {})
+            if not _page_exists(page_data):
                 return {"title": title, "exists": False, "error": "Page does not exist"}
 
-            # Get sections
-            sections = self._extract_sections(page.sections)
-
-            # Get categories
-            categories = [cat for cat in page.categories.keys()]
-
-            # Get links
-            links = [link for link in page.links.keys()]
+            extract = page_data.get("extract", "")
+            summary, text = _render_extract(extract)
 
             return {
-                "title": page.title,
-                "pageid": page.pageid,
-                "summary": page.summary,
-                "text": page.text,
-                "url": page.fullurl,
-                "sections": sections,
-                "categories": categories,
-                "links": links[:100],  # Limit to 100 links to avoid too much data
+                "title": page_data.get("title", title),
+                "pageid": page_data["pageid"],
+                "summary": summary,
+                "text": text,
+                "url": page_data.get("fullurl", ""),
+                "sections": _parse_sections(extract),
+                "categories": [category["title"] for category in page_data.get("categories", [])],
+                # Limit to 100 links to avoid too much data
+                "links": [link["title"] for link in itertools.islice(page_data.get("links", []), 100)],
                 "exists": True,
             }
         except Exception as e:
@@ -678,7 +1346,7 @@ class WikipediaClient:
             if not page.exists():
                 return []
 
-            return [link for link in page.links.keys()]
+            return list(page.links.keys())
         except Exception as e:
             logger.error(f"Error getting Wikipedia links: {e}")
             return []
@@ -686,10 +1354,77 @@ class WikipediaClient:
     # ------------------------------------------------------------------
     # Related topics
     # ------------------------------------------------------------------
+    def _fetch_links(self, title: str, limit: int) -> List[str]:
+        """Fetch the titles of the first ``limit`` pages linked from an article."""
+        return list(itertools.islice(self.wiki.page(title).links.keys(), limit))
+
+    def _fetch_categories(self, title: str, limit: int) -> List[str]:
+        """Fetch the first ``limit`` categories of an article."""
+        return list(itertools.islice(self.wiki.page(title).categories.keys(), limit))
+
+    def _describe_link_batch(self, batch: List[str]) -> List[Dict[str, Any]]:
+        """Build related-topic entries for the existing pages among ``batch``, in order."""
+        aliases: Dict[str, str] = {}
+        pages = self._query_pages(
+            {
+                "action": "query",
+                "format": "json",
+                "prop": "extracts|info",
+                "exintro": 1,
+                "explaintext": 1,
+                "exlimit": "max",
+                "inprop": "url",
+                "redirects": 1,
+                "titles": "|".join(batch),
+            },
+            aliases,
+        )
+        by_title = {page["title"]: page for page in pages.values() if _page_exists(page)}
+
+        related: List[Dict[str, Any]] = []
+        for link in batch:
+            resolved = aliases.get(link, link)
+            page = by_title.get(aliases.get(resolved, resolved))
+            if page is None:
+                continue
+            summary = page.get("extract", "")
+            related.append(
+                {
+                    "title": link,
+                    "summary": summary[:200] + "..." if len(summary) > 200 else summary,
+                    "url": page.get("fullurl", ""),
+                    "type": "link",
+                }
+            )
+        return related
+
+    def _describe_links(self, links: List[str], limit: int) -> List[Dict[str, Any]]:
+        """
+        Build related-topic entries for the existing pages among the first ``limit`` links.
+
+        Intro extracts and URLs are fetched with one prop=extracts|info query
+        per _INTRO_EXTRACTS_PER_QUERY links instead of one request per link; when
+        there are several such batches they are fetched concurrently on the
+        pooled session (at most _MAX_CONCURRENT_CALLS at a time). Missing
+        pages are skipped; redirects resolve to their targets.
+        """
+        candidates = links[:limit]
+        batches = [
+            candidates[start : start + _INTRO_EXTRACTS_PER_QUERY]
+            for start in range(0, len(candidates), _INTRO_EXTRACTS_PER_QUERY)
+        ]
+        if len(batches) <= 1:
+            return [entry for batch in batches for entry in self._describe_link_batch(batch)]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(batches), _MAX_CONCURRENT_CALLS)) as executor:
+            return [entry for described in executor.map(self._describe_link_batch, batches) for entry in described]
+
     def get_related_topics(self, title: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get topics related to a Wikipedia article based on links and categories.
 
+        The article's links and categories are fetched concurrently.
+
         Args:
             title: The title of the Wikipedia article.
             limit: Maximum number of related topics to return.
@@ -698,37 +1433,14 @@ class WikipediaClient:
             A list of related topics.
         """
         try:
-            page = self.wiki.page(title)
-
-            if not page.exists():
-                return []
-
-            # Get links from the page
-            links = list(page.links.keys())
-
-            # Get categories
-            categories = list(page.categories.keys())
-
-            related = []
+            # Missing pages have neither links nor categories
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                links_future = executor.submit(self._fetch_links, title, limit)
+                categories = executor.submit(self._fetch_categories, title, limit).result()
+                links = links_future.result()
 
             # Add links first
-            for link in links[:limit]:
-                link_page = self.wiki.page(link)
-                if link_page.exists():
-                    related.append(
-                        {
-                            "title": link,
-                            "summary": (
-                                link_page.summary[:200] + "..."
-                                if len(link_page.summary) > 200
-                                else link_page.summary
-                            ),
-                            "url": link_page.fullurl,
-                            "type": "link",
-                        }
-                    )
-                if len(related) >= limit:
-                    break
+            related = self._describe_links(links, limit)
 
             # Add categories if we still have room
             remaining = limit - len(related)
@@ -743,36 +1455,81 @@ class WikipediaClient:
             logger.error(f"Error getting related topics: {e}")
             return []
 
+    async def get_related_topics_async(self, title: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get topics related to a Wikipedia article without blocking the event loop.
+
+        Runs get_related_topics in a worker thread.
+
+        Args:
+            title: The title of the Wikipedia article.
+            limit: Maximum number of related topics to return.
+
+        Returns:
+            A list of related topics.
+        """
+        return await asyncio.to_thread(self.get_related_topics, title, limit)
+
     # ------------------------------------------------------------------
     # Fact extraction
     # ------------------------------------------------------------------
     def _extract_sections(self, sections, level=0) -> List[Dict[str, Any]]:
         """
-        Extract sections recursively.
+        Extract sections and their subsections into nested dicts.
+
+        The section tree is walked with an explicit stack rather than by
+        recursion, so arbitrarily deep tables of contents cost no Python frames.
 
         Args:
             sections: The sections to extract.
-            level: The current section level.
+            level: The level of the top-level sections.
 
         Returns:
             A list of sections.
         """
-        result = []
-        for section in sections:
+        result: List[Dict[str, Any]] = []
+        # (section, level, list to append it to); siblings are pushed in
+        # reverse so they are popped in document order
+        stack = [(section, level, result) for section in reversed(sections)]
+        while stack:
+            section, section_level, siblings = stack.pop()
             section_data = {
                 "title": section.title,
-                "level": level,
+                "level": section_level,
                 "text": section.text,
-                "sections": self._extract_sections(section.sections, level + 1),
+                "sections": [],
             }
-            result.append(section_data)
+            siblings.append(section_data)
+            stack.extend((child, section_level + 1, section_data["sections"]) for child in reversed(section.sections))
         return result
 
+    def _fetch_text_and_summary(self, title: str) -> Tuple[str, str]:
+        """Fetch the full text and the summary of an article."""
+        page = self.wiki.page(title)
+        return page.text, page.summary
+
+    def _search_snippet(self, title: str, query: str) -> Optional[str]:
+        """
+        Return the search index's plain-text match snippet for ``query`` within article ``title``.
+
+        Returns:
+            The snippet, or None if the top search hit is not the article or has no snippet.
+        """
+        search_query = '"{}" intitle:"{}"'.format(query.replace('"', " "), title.replace('"', " "))
+        hits = self.search(search_query, limit=1)
+        if not hits or hits[0]["title"].casefold() != title.replace("_", " ").strip().casefold():
+            return None
+        return html.unescape(_HTML_TAG_RE.sub("", hits[0]["snippet"])).strip() or None
+
     def summarize_for_query(self, title: str, query: str, max_length: int = 250) -> str:
         """
         Get a summary of a Wikipedia article tailored to a specific query.
 
-        This is a simplified implementation that returns a snippet around the query.
+        The snippet the search index builds for the query within the article
+        is returned when there is one, which avoids downloading the article.
+        Otherwise this falls back to a snippet around the first occurrence of
+        the query in the article text; the existence check and the text fetch
+        then run concurrently.
 
         Args:
             title: The title of the Wikipedia article.
@@ -783,18 +1540,24 @@ class WikipediaClient:
             A query-focused summary.
         """
         try:
-            page = self.wiki.page(title)
-            if not page.exists():
+            snippet = self._search_snippet(title, query)
+            if snippet:
+                return snippet[:max_length] + "..." if len(snippet) > max_length else snippet
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                exists_future = executor.submit(lambda: self.wiki.page(title).exists())
+                text_content, summary = executor.submit(self._fetch_text_and_summary, title).result()
+                exists = exists_future.result()
+            if not exists:
                 return f"No Wikipedia article found for '{title}'."
 
-            text_content = page.text
             query_lower = query.lower()
             text_lower = text_content.lower()
 
             start_index = text_lower.find(query_lower)
             if start_index == -1:
                 # If query not found, return the beginning of the summary or article text
-                summary_part = page.summary[:max_length]
+                summary_part = summary[:max_length]
                 if not summary_part:
                     summary_part = text_content[:max_length]
                 return summary_part + "..." if len(summary_part) >= max_length else summary_part
@@ -814,6 +1577,45 @@ class WikipediaClient:
             logger.error(f"Error generating query-focused summary for '{title}': {e}")
             return f"Error generating query-focused summary for '{title}': {str(e)}"
 
+    async def summarize_for_query_async(self, title: str, query: str, max_length: int = 250) -> str:
+        """
+        Get a summary of a Wikipedia article tailored to a specific query without blocking the event loop.
+
+        Runs summarize_for_query in a worker thread.
+
+        Args:
+            title: The title of the Wikipedia article.
+            query: The query to focus the summary on.
+            max_length: The maximum length of the summary.
+
+        Returns:
+            A query-focused summary.
+        """
+        return await asyncio.to_thread(self.summarize_for_query, title, query, max_length)
+
+    def _section_index(self, title: str) -> Optional[Dict[str, str]]:
+        """
+        Map the casefolded section titles of an article to the sections' text.
+
+        When a title repeats, the first section in document order wins. With
+        enable_cache the index is cached like the public lookups, so
+        summarizing several sections of one article fetches and walks it once.
+
+        Args:
+            title: The title of the Wikipedia article.
+
+        Returns:
+            The index, or None if the article does not exist.
+        """
+        page = self.wiki.page(title)
+        if not page.exists():
+            return None
+
+        index: Dict[str, str] = {}
+        for section in _walk_sections(page.sections):
+            index.setdefault(section.title.casefold(), section.text)
+        return index
+
     def summarize_section(self, title: str, section_title: str, max_length: int = 150) -> str:
         """
         Get a summary of a specific section of a Wikipedia article.
@@ -827,30 +1629,17 @@ class WikipediaClient:
             A summary of the specified section.
         """
         try:
-            page = self.wiki.page(title)
-            if not page.exists():
+            index = self._section_index(title)
+            if index is None:
                 return f"No Wikipedia article found for '{title}'."
 
-            target_section = None
-
-            # Helper function to find the section
-            def find_section_recursive(sections_list, target_title):
-                for sec in sections_list:
-                    if sec.title.lower() == target_title.lower():
-                        return sec
-                    # Check subsections
-                    found_in_subsection = find_section_recursive(sec.sections, target_title)
-                    if found_in_subsection:
-                        return found_in_subsection
-                return None
+            section_text = index.get(section_title.casefold())
 
-            target_section = find_section_recursive(page.sections, section_title)
-
-            if not target_section or not target_section.text:
+            if not section_text:
                 return f"Section '{section_title}' not found or is empty in article '{title}'."
 
-            summary = target_section.text[:max_length]
-            return summary + "..." if len(target_section.text) > max_length else summary
+            summary = section_text[:max_length]
+            return summary + "..." if len(section_text) > max_length else summary
 
         except Exception as e:
             logger.error(f"Error summarizing section '{section_title}' for article '{title}': {e}")
@@ -884,16 +1673,8 @@ class WikipediaClient:
             text_to_process = ""
             if topic_within_article:
                 # Try to find the section text
-                def find_section_text_recursive(sections_list, target_title):
-                    for sec in sections_list:
-                        if sec.title.lower() == target_title.lower():
-                            return sec.text
-                        found_in_subsection = find_section_text_recursive(sec.sections, target_title)
-                        if found_in_subsection:
-                            return found_in_subsection
-                    return None
-
-                section_text = find_section_text_recursive(page.sections, topic_within_article)
+                section = _find_section(page.sections, topic_within_article.casefold())
+                section_text = section.text if section is not None else None
                 if section_text:
                     text_to_process = section_text
                 else:
@@ -905,13 +1686,9 @@ class WikipediaClient:
             if not text_to_process:
                 return ["No content found to extract facts from."]
 
-            # Basic sentence splitting (can be improved with NLP libraries)
-            sentences = [s.strip() for s in text_to_process.split(".") if s.strip()]
-
-            facts: List[str] = []
-            for sentence in sentences[:count]:
-                if sentence:  # Ensure not an empty string after strip
-                    facts.append(sentence + ".")  # Add back the period
+            # Basic sentence splitting (can be improved with NLP libraries);
+            # only the first ``count`` sentences are ever scanned.
+            facts = list(itertools.islice(_iter_sentences(text_to_process), max(count, 0)))
 
             return facts if facts else ["Could not extract facts from the provided text."]
 
@@ -932,83 +1709,479 @@ class WikipediaClient:
         Returns:
             A dictionary containing the coordinates information.
         """
-        params = {
-            "action": "query",
-            "format": "json",
-            "prop": "coordinates",
-            "titles": title,
-        }
-        # Add variant parameter if needed
-        params = self._add_variant_to_params(params)
+        return self.get_coordinates_batch([title])[title]
+
+    def get_coordinates_batch(self, titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the coordinates of several Wikipedia articles.
+
+        Titles are looked up with one prop=coordinates query per
+        _TITLES_PER_QUERY titles instead of one request per title. If a
+        request fails, every title in that batch gets an error entry. With
+        caching enabled, answered lookups are cached per normalized title;
+        failed requests are not.
+
+        Args:
+            titles: The titles of the Wikipedia articles.
+
+        Returns:
+            A dictionary mapping each requested title to the same dictionary
+            get_coordinates returns for it.
+        """
+        unique_titles = list(dict.fromkeys(titles))
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: List[str] = []
+        for title in unique_titles:
+            cached = self._coord_cache.get(_title_key(title)) if self._coord_cache is not None else None
+            if cached is not None:
+                results[title] = cached
+            else:
+                pending.append(title)
+
+        for start in range(0, len(pending), _TITLES_PER_QUERY):
+            batch = pending[start : start + _TITLES_PER_QUERY]
+            aliases: Dict[str, str] = {}
+            try:
+                pages = self._query_pages({**_COORD_PARAMS, "titles": "|".join(batch)}, aliases)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # Network, HTTP status, API and JSON decode failures that
+                # remain after the session's retries
+                logger.error("%s when getting coordinates for '%s': %s", type(e).__name__, "|".join(batch), e)
+                results.update((title, self._coordinates_error(title, e)) for title in batch)
+                continue
+
+            by_title = {page.get("title"): page for page in pages.values()}
+            for title in batch:
+                page_data = by_title.get(aliases.get(title, title))
+                if page_data is None:
+                    results[title] = {
+                        "title": title,
+                        "coordinates": None,
+                        "exists": False,
+                        "error": "No page found",
+                    }
+                else:
+                    results[title] = self._build_coordinates_result(title, page_data)
+                if self._coord_cache is not None:
+                    self._coord_cache[_title_key(title)] = results[title]
+
+        return {title: results[title] for title in unique_titles}
+
+    async def get_coordinates_async(self, title: str) -> Dict[str, Any]:
+        """
+        Get the coordinates of a Wikipedia article without blocking the event loop.
+
+        Uses the shared async HTTP client, so many lookups can be awaited
+        together (e.g. with asyncio.gather) over its pooled connections;
+        concurrent identical requests are coalesced. When caching is enabled
+        the request goes through the cached get_coordinates instead.
+
+        Args:
+            title: The title of the Wikipedia article.
+
+        Returns:
+            The same dictionary as get_coordinates.
+        """
+        if self.enable_cache:
+            return await self.call_async("get_coordinates", title)
+
+        params = self._add_variant_to_params({**_COORD_PARAMS, "titles": title})
 
         try:
-            response = requests.get(self.api_url, headers=self._get_request_headers(), params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._singleflight(("get_coordinates", title), lambda: self._get_async(params))
+            return self._coordinates_from_response(title, data)
 
-            pages = data.get("query", {}).get("pages", {})
+        except Exception as e:
+            logger.error(f"Error getting coordinates for Wikipedia article: {e}")
+            return self._coordinates_error(title, e)
+
+    @staticmethod
+    def _coordinates_error(title: str, error: Exception) -> Dict[str, Any]:
+        """Build the coordinates response for a lookup whose request failed."""
+        return {
+            "title": title,
+            "coordinates": None,
+            "exists": False,
+            "error": str(error),
+        }
 
-            if not pages:
-                return {
-                    "title": title,
-                    "coordinates": None,
-                    "exists": False,
-                    "error": "No page found",
-                }
+    def _coordinates_from_response(self, title: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the coordinates response from a decoded prop=coordinates API response.
 
-            # Get the first (and typically only) page
-            page_data = next(iter(pages.values()))
+        Args:
+            title: The requested article title.
+            data: The decoded JSON response (formatversion=2).
 
-            # Check if page exists (pageid > 0 means page exists)
-            if page_data.get("pageid", -1) < 0:
-                return {
-                    "title": title,
-                    "coordinates": None,
-                    "exists": False,
-                    "error": "Page does not exist",
-                }
+        Returns:
+            A dictionary containing the coordinates information.
 
-            coordinates = page_data.get("coordinates", [])
+        Raises:
+            ValueError: If the API reported an error.
+        """
+        _check_api_error(data)
+        pages = data.get("query", {}).get("pages", [])
 
-            if not coordinates:
-                return {
-                    "title": page_data.get("title", title),
-                    "pageid": page_data.get("pageid"),
-                    "coordinates": None,
-                    "exists": True,
-                    "error": None,
-                    "message": "No coordinates available for this article",
-                }
+        if not pages:
+            return {
+                "title": title,
+                "coordinates": None,
+                "exists": False,
+                "error": "No page found",
+            }
 
-            # Process coordinates - typically there's one primary coordinate
-            processed_coordinates = []
-            for coord in coordinates:
-                processed_coordinates.append(
-                    {
-                        "latitude": coord.get("lat"),
-                        "longitude": coord.get("lon"),
-                        "primary": coord.get("primary", False),
-                        "globe": coord.get("globe", "earth"),
-                        "type": coord.get("type", ""),
-                        "name": coord.get("name", ""),
-                        "region": coord.get("region", ""),
-                        "country": coord.get("country", ""),
-                    }
-                )
+        # Only one title was requested
+        return self._build_coordinates_result(title, pages[0])
+
+    def _build_coordinates_result(self, title: str, page_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the coordinates response for a single page from an API page entry.
+
+        Args:
+            title: The requested article title.
+            page_data: The page entry from a prop=coordinates query.
+
+        Returns:
+            A dictionary containing the coordinates information.
+        """
+        # Missing and invalid titles are flagged by the API; their
+        # coordinate lists are never looked at
+        if not _page_exists(page_data):
+            return {
+                "title": title,
+                "coordinates": None,
+                "exists": False,
+                "error": "Page does not exist",
+            }
+
+        coordinates = page_data.get("coordinates", [])
 
+        if not coordinates:
             return {
                 "title": page_data.get("title", title),
                 "pageid": page_data.get("pageid"),
-                "coordinates": processed_coordinates,
+                "coordinates": None,
                 "exists": True,
                 "error": None,
+                "message": "No coordinates available for this article",
             }
 
+        # Process coordinates - typically there's one primary coordinate
+        processed_coordinates = [
+            {field: coord.get(api_field, default) for field, api_field, default in _COORD_FIELDS}
+            for coord in coordinates
+        ]
+
+        return {
+            "title": page_data.get("title", title),
+            "pageid": page_data.get("pageid"),
+            "coordinates": processed_coordinates,
+            "exists": True,
+            "error": None,
+        }
+
+    # ------------------------------------------------------------------
+    # Bundled lookups
+    # ------------------------------------------------------------------
+    def get_article_bundle(
+        self,
+        title: str,
+        include: Tuple[str, ...] = ("sections", "links", "coordinates"),
+    ) -> Dict[str, Any]:
+        """
+        Get several aspects of a Wikipedia article with a single API request.
+
+        Args:
+            title: The title of the Wikipedia article.
+            include: The aspects to fetch: any of "sections", "links" and "coordinates".
+
+        Returns:
+            A dictionary with the article title, existence flag and one entry per
+            requested aspect. Sections and links default to empty lists and
+            coordinates to the same dictionary get_coordinates returns.
+        """
+        error = self._check_bundle_parts(title, include)
+        if error:
+            return error
+        try:
+            pages = self._query_pages(self._bundle_params(title, include))
         except Exception as e:
-            logger.error(f"Error getting coordinates for Wikipedia article: {e}")
+            logger.error(f"Error getting article bundle for '{title}': {e}")
+            return self._build_bundle(title, include, None, e)
+        return self._build_bundle(title, include, pages)
+
+    async def get_article_bundle_async(
+        self,
+        title: str,
+        include: Tuple[str, ...] = ("sections", "links", "coordinates"),
+    ) -> Dict[str, Any]:
+        """
+        Get several aspects of a Wikipedia article with a single API request.
+
+        Uses the shared async HTTP client; concurrent identical requests are
+        coalesced. When caching is enabled the request goes through the cached
+        get_article_bundle instead, so both paths share one cache.
+
+        Args:
+            title: The title of the Wikipedia article.
+            include: The aspects to fetch: any of "sections", "links" and "coordinates".
+
+        Returns:
+            The same dictionary as get_article_bundle.
+        """
+        include = tuple(include)
+        if self.enable_cache:
+            return await self.call_async("get_article_bundle", title, include)
+
+        error = self._check_bundle_parts(title, include)
+        if error:
+            return error
+        try:
+            pages = await self._singleflight(
+                ("get_article_bundle", title, include),
+                lambda: self._query_pages_async(self._bundle_params(title, include)),
+            )
+        except Exception as e:
+            logger.error(f"Error getting article bundle for '{title}': {e}")
+            return self._build_bundle(title, include, None, e)
+        return self._build_bundle(title, include, pages)
+
+    @staticmethod
+    def _check_bundle_parts(title: str, include: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Return an error response if ``include`` names unsupported aspects."""
+        unsupported = [part for part in include if part not in _BUNDLE_PROPS]
+        if unsupported:
             return {
                 "title": title,
-                "coordinates": None,
                 "exists": False,
-                "error": str(e),
+                "error": f"Unsupported bundle part(s): {', '.join(unsupported)}",
             }
+        return None
+
+    @staticmethod
+    def _bundle_params(title: str, include: Tuple[str, ...]) -> Dict[str, Any]:
+        """Build the action=query parameters for a bundle request."""
+        params: Dict[str, Any] = {
+            "action": "query",
+            "format": "json",
+            "formatversion": _COORD_PARAMS["formatversion"],
+            "titles": title,
+            "prop": "|".join(_BUNDLE_PROPS[part] for part in include),
+            "redirects": 1,
+        }
+        if "sections" in include:
+            params["explaintext"] = 1
+            params["exsectionformat"] = "wiki"
+        if "links" in include:
+            params["pllimit"] = "max"
+        if "coordinates" in include:
+            # Same coordinate fields and limit as get_coordinates
+            params["coprop"] = _COORD_PARAMS["coprop"]
+            params["colimit"] = _COORD_PARAMS["colimit"]
+        return params
+
+    def _build_bundle(
+        self,
+        title: str,
+        include: Tuple[str, ...],
+        pages: Optional[Dict[str, Dict[str, Any]]],
+        error: Optional[Exception] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build a bundle response from queried pages or a request error.
+
+        Args:
+            title: The requested article title.
+            include: The requested aspects.
+            pages: The pages returned by the query, or None if it failed.
+            error: The exception raised by a failed query.
+
+        Returns:
+            The bundle dictionary.
+        """
+        bundle: Dict[str, Any] = {"title": title}
+        if pages is None:
+            bundle.update({"exists": False, "error": str(error)})
+            page_data: Dict[str, Any] = {}
+        else:
+            page_data = next(iter(pages.values()), {})
+            exists = _page_exists(page_data)
+            bundle.update(
+                {
+                    "title": page_data.get("title", title),
+                    "pageid": page_data.get("pageid"),
+                    "exists": exists,
+                    "error": None if exists else "Page does not exist",
+                }
+            )
+
+        if "sections" in include:
+            bundle["sections"] = _parse_sections(page_data.get("extract", ""))
+        if "links" in include:
+            bundle["links"] = [link["title"] for link in page_data.get("links", [])]
+        if "coordinates" in include:
+            if page_data:
+                bundle["coordinates"] = self._build_coordinates_result(title, page_data)
+            else:
+                bundle["coordinates"] = {
+                    "title": title,
+                    "coordinates": None,
+                    "exists": False,
+                    "error": bundle["error"] or "No page found",
+                }
+        return bundle
+
+
+# ----------------------------------------------------------------------
+# Shared result caches
+# ----------------------------------------------------------------------
+class _ClientKey:
+    """
+    Hashable cache key for the configuration a client's results depend on.
+
+    Keys compare equal for clients with the same base language, variant and
+    access token, so such clients share cache entries. The client itself is
+    only referenced weakly, so cached entries never keep clients alive.
+    """
+
+    __slots__ = ("_config", "_client_ref")
+
+    def __init__(self, client: WikipediaClient):
+        self._config = (client.base_language, client.language_variant, client.access_token)
+        self._client_ref = weakref.ref(client)
+
+    @property
+    def client(self) -> WikipediaClient:
+        client = self._client_ref()
+        if client is None:
+            raise ReferenceError("the client for this cache key has been garbage collected")
+        return client
+
+    def __hash__(self) -> int:
+        return hash(self._config)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ClientKey) and self._config == other._config
+
+
+class _SharedCache(Protocol):
+    """A ``functools.lru_cache`` wrapper around a method taking a ``_ClientKey``."""
+
+    def __call__(self, key: _ClientKey, *args: Any, **kwargs: Any) -> Any: ...
+
+    def cache_info(self) -> Any: ...
+
+    def cache_clear(self) -> None: ...
+
+
+class _BoundCache:
+    """
+    A shared method cache bound to one client's cache key.
+
+    Calls look like calls to the plain method; ``cache_info`` and
+    ``cache_clear`` are forwarded to the shared cache.
+    """
+
+    __slots__ = ("_cache", "_key")
+
+    def __init__(self, cache: _SharedCache, key: _ClientKey):
+        self._cache = cache
+        self._key = key
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._cache(self._key, *args, **kwargs)
+
+    def cache_info(self) -> Any:
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        self._cache.cache_clear()
+
+
+class _AsyncRateLimiter:
+    """
+    Token bucket limiting async requests to ``rate`` per second.
+
+    Bursts of up to ``rate`` requests go out at once; further callers sleep
+    until their token is due. Tokens are reserved before sleeping, so the
+    bucket needs no lock on a single event loop.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class _TTLCache:
+    """Thread-safe LRU mapping whose entries expire ``ttl`` seconds after being stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "collections.OrderedDict[Any, Tuple[float, Any]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _make_shared_cache(name: str) -> _SharedCache:
+    """Build the module-level LRU cache for the WikipediaClient method ``name``."""
+    method = getattr(WikipediaClient, name)
+
+    @functools.lru_cache(maxsize=128)
+    def cached(key: _ClientKey, *args: Any, **kwargs: Any) -> Any:
+        return method(key.client, *args, **kwargs)
+
+    return cached
+
+
+# Methods cached when a client is created with enable_cache=True
+_SHARED_CACHES: Dict[str, _SharedCache] = {
+    name: _make_shared_cache(name)
+    for name in (
+        "search",
+        "get_article",
+        "get_summary",
+        "get_sections",
+        "get_links",
+        "get_related_topics",
+        "summarize_for_query",
+        "summarize_section",
+        "_section_index",
+        "extract_facts",
+        "get_article_bundle",
+    )
+}